@@ -17,10 +17,20 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import json
 import logging
+import logging.handlers
+import queue
+import atexit
 import traceback
 from datetime import datetime
 import csv
+import io
+import gzip
+import shutil
 import re
+import string
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import webbrowser
@@ -34,9 +44,22 @@ import winreg
 import ctypes
 import ctypes.wintypes
 
+try:
+    import orjson  # Optional: faster JSON import/export
+except ImportError:
+    orjson = None
+
+try:
+    import rcssmin  # Optional: smaller stylesheet in generated quizzes
+except ImportError:
+    rcssmin = None
+
 # Windows Registry Path where values are stored
 WINDOWS_REGISTRY_PATH = r"Software\Multiaxis LLC\Multiaxis Intelligence - Quiz Generator\Info"
 
+# In-process cache of registry reads, keyed by (registry_path, name)
+_REGISTRY_CACHE = {}
+
 # Application constants
 APP_NAME = "Multiaxis Quiz Generator"
 APP_COMPANY = "Multiaxis LLC"
@@ -45,9 +68,23 @@ APP_DATA_FOLDER = os.path.join(os.getenv('APPDATA'), APP_COMPANY, APP_NAME)
 # Mutex for single instance
 APP_MUTEX = None
 
+# Background thread that writes queued log records
+LOG_LISTENER = None
+
+# Active log file, set by main() so importing the module (e.g. in a
+# generate_many() worker process) does not configure logging
+LOG_FILE = None
 
+# Logging configuration
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(funcName)s - %(message)s'
+LOG_BUFFER_CAPACITY = 512  # Records buffered before the log file is written
+LOG_MAX_BYTES = 5 * 1024 * 1024  # Rotate the log file once it reaches this size
+LOG_BACKUP_COUNT = 10  # Rotated log files kept on disk
+
+
+@functools.lru_cache(maxsize=None)
 def create_app_mutex():
-    """Create a Windows mutex to ensure only one instance of the app runs."""
+    """Create a Windows mutex to ensure only one instance of the app runs (checked once)."""
     global APP_MUTEX
     
     kernel32 = ctypes.windll.kernel32
@@ -66,17 +103,14 @@ def create_app_mutex():
     return True
 
 
+@functools.lru_cache(maxsize=None)
 def setup_application_folders():
-    """Create necessary application folders in AppData."""
-    folders = [
-        APP_DATA_FOLDER,
-        os.path.join(APP_DATA_FOLDER, 'logs'),
-        os.path.join(APP_DATA_FOLDER, 'settings'),
-        os.path.join(APP_DATA_FOLDER, 'temp')
-    ]
+    """Create necessary application folders in AppData (once per session)."""
+    base = Path(APP_DATA_FOLDER)
+    base.mkdir(parents=True, exist_ok=True)
     
-    for folder in folders:
-        os.makedirs(folder, exist_ok=True)
+    for subfolder in ('logs', 'settings', 'temp'):
+        (base / subfolder).mkdir(exist_ok=True)
     
     return True
 
@@ -86,21 +120,29 @@ def set_registry_value(name, value, registry_path=WINDOWS_REGISTRY_PATH):
     try:
         with winreg.CreateKey(winreg.HKEY_CURRENT_USER, registry_path) as key:
             winreg.SetValueEx(key, name, 0, winreg.REG_SZ, str(value))
-        logging.debug(f"Registry value set - {name}: {value}")
+        _REGISTRY_CACHE[(registry_path, name)] = str(value)
+        logging.debug("Registry value set - %s: %s", name, value)
     except Exception as e:
+        _REGISTRY_CACHE.pop((registry_path, name), None)
         logging.error(f"Failed to set registry value {name}: {e}")
         print(f"Failed to set registry value {name}: {e}")
 
 
 def get_registry_value(name, registry_path=WINDOWS_REGISTRY_PATH):
     """Get a value from the registry, or return None if not found."""
+    cache_key = (registry_path, name)
+    if cache_key in _REGISTRY_CACHE:
+        return _REGISTRY_CACHE[cache_key]
+    
     try:
         with winreg.OpenKey(winreg.HKEY_CURRENT_USER, registry_path, 0, winreg.KEY_READ) as key:
             value, _ = winreg.QueryValueEx(key, name)
-            logging.debug(f"Retrieved registry value - {name}: {value}")
+            logging.debug("Retrieved registry value - %s: %s", name, value)
+            _REGISTRY_CACHE[cache_key] = value
             return value
     except FileNotFoundError:
-        logging.debug(f"Registry value not found: {name}")
+        logging.debug("Registry value not found: %s", name)
+        _REGISTRY_CACHE[cache_key] = None
         return None
     except Exception as e:
         logging.error(f"Failed to get registry value {name}: {e}")
@@ -108,12 +150,13 @@ def get_registry_value(name, registry_path=WINDOWS_REGISTRY_PATH):
         return None
 
 
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """Get absolute path to resource, works for both development and PyInstaller environments."""
     try:
         # PyInstaller creates a temporary folder and stores the path in sys._MEIPASS
         base_path = sys._MEIPASS
-        logging.debug(f"PyInstaller temp folder path (sys._MEIPASS): {base_path}")
+        logging.debug("PyInstaller temp folder path (sys._MEIPASS): %s", base_path)
     except AttributeError:
         # If not running in a PyInstaller bundle, use the script's directory
         # Get the directory where this script is located
@@ -121,15 +164,31 @@ def resource_path(relative_path):
         # If we're in a src directory, go up one level to find assets
         if os.path.basename(base_path) == 'src':
             base_path = os.path.dirname(base_path)
-        logging.debug(f"Development base path: {base_path}")
+        logging.debug("Development base path: %s", base_path)
     
     full_path = os.path.join(base_path, relative_path)
-    logging.debug(f"Full resource path: {full_path}")
+    logging.debug("Full resource path: %s", full_path)
     return full_path
 
 
+@functools.lru_cache(maxsize=None)
+def get_logo_base64():
+    """Get the company logo as a data URI, encoded once per session."""
+    logo_path = resource_path('assets/MultiaxisQuizGenerator_logo.png')
+    try:
+        with open(logo_path, 'rb') as f:
+            logo_base64 = base64.b64encode(f.read()).decode('utf-8')
+        logging.info("Logo successfully encoded as base64")
+        return f"data:image/png;base64,{logo_base64}"
+    except Exception as e:
+        logging.warning(f"Could not load logo: {e}")
+        # Fallback to SVG placeholder
+        return "data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='200' height='80' viewBox='0 0 200 80'%3E%3Crect width='200' height='80' fill='%232C5282'/%3E%3Ctext x='100' y='40' font-family='Arial' font-size='16' fill='white' text-anchor='middle' dominant-baseline='middle'%3EMULTIAXIS%3C/text%3E%3C/svg%3E"
+
+
+@functools.lru_cache(maxsize=None)
 def setup_logging():
-    """Initialize logging with proper AppData location."""
+    """Initialize logging with proper AppData location (configured once per session)."""
     try:
         # Ensure folders exist
         setup_application_folders()
@@ -137,23 +196,36 @@ def setup_logging():
         # Create logs directory
         logs_dir = os.path.join(APP_DATA_FOLDER, 'logs')
         
-        # Create timestamped log file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_filename = f"quiz_generator_{timestamp}.log"
-        LOG_FILE = os.path.join(logs_dir, log_filename)
+        # Single stable log file, rotated by size instead of one file per session
+        LOG_FILE = os.path.join(logs_dir, 'quiz_generator.log')
+        
+        formatter = logging.Formatter(LOG_FORMAT)
+        file_handler = logging.handlers.RotatingFileHandler(
+            LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+            encoding='utf-8', delay=True
+        )
+        file_handler.setFormatter(formatter)
+        
+        stream_handler = logging.StreamHandler()  # Still log to console
+        stream_handler.setFormatter(formatter)
+        output_handlers = [
+            # Buffer file writes in memory; flushed in batches, on errors and at exit
+            logging.handlers.MemoryHandler(LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler),
+            stream_handler
+        ]
         
-        # Also create a 'latest.log' that always points to the most recent session
-        latest_log = os.path.join(logs_dir, 'latest.log')
+        # Hand records to a background thread so logging never blocks on I/O
+        global LOG_LISTENER
+        log_queue = queue.Queue(-1)
+        LOG_LISTENER = logging.handlers.QueueListener(log_queue, *output_handlers)
+        LOG_LISTENER.start()
+        atexit.register(LOG_LISTENER.stop)
         
-        # Configure logging
+        # Configure logging (records are fully formatted by the listener's handlers)
         logging.basicConfig(
             level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)s - %(funcName)s - %(message)s',
-            handlers=[
-                logging.FileHandler(LOG_FILE),
-                logging.FileHandler(latest_log, mode='w'),  # Overwrite latest.log
-                logging.StreamHandler()  # Still log to console
-            ]
+            format='%(message)s',
+            handlers=[logging.handlers.QueueHandler(log_queue)]
         )
         
         logging.info("="*60)
@@ -162,9 +234,6 @@ def setup_logging():
         logging.info(f"AppData folder: {APP_DATA_FOLDER}")
         logging.info("="*60)
         
-        # Clean up old logs (keep only last 10)
-        clean_old_logs(logs_dir)
-        
         return LOG_FILE
         
     except Exception as e:
@@ -172,7 +241,7 @@ def setup_logging():
         fallback_log = "MultiaxisQuizGenerator.log"
         logging.basicConfig(
             level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)s - %(funcName)s - %(message)s',
+            format=LOG_FORMAT,
             filename=fallback_log
         )
         logging.error(f"Error setting up logging in AppData: {e}")
@@ -180,439 +249,101 @@ def setup_logging():
         return fallback_log
 
 
-def clean_old_logs(logs_dir, keep_count=10):
-    """Clean up old log files, keeping only the most recent ones."""
-    try:
-        # Get all log files except 'latest.log'
-        log_files = [f for f in os.listdir(logs_dir) 
-                    if f.startswith('quiz_generator_') and f.endswith('.log')]
-        
-        # Sort by modification time
-        log_files.sort(key=lambda x: os.path.getmtime(os.path.join(logs_dir, x)))
-        
-        # Remove oldest files if we have too many
-        while len(log_files) > keep_count:
-            old_file = log_files.pop(0)
-            try:
-                os.remove(os.path.join(logs_dir, old_file))
-                logging.debug(f"Removed old log file: {old_file}")
-            except:
-                pass
-                
-    except Exception as e:
-        logging.debug(f"Error cleaning old logs: {e}")
-
-
-# Initialize logging before anything else
-LOG_FILE = setup_logging()
-
-
 # --- Sample Quizzes --
 
 
-SAMPLE_QUIZZES = {
-    "CNC Manufacturing Fundamentals": {
-        "description": "Test your knowledge of CNC machining and manufacturing processes",
-        "questions": [
-            {
-                "question": "What does CNC stand for?",
-                "options": ["Computer Numerical Control", "Central Network Computer", "Computerized Navigation Center", "Control Number Code"],
-                "correct": 0,
-                "explanation": "CNC stands for Computer Numerical Control, which refers to the automated control of machining tools by means of a computer."
-            },
-            {
-                "question": "Which G-code is typically used for rapid positioning?",
-                "options": ["G00", "G01", "G02", "G03"],
-                "correct": 0,
-                "explanation": "G00 is the rapid positioning command that moves the tool at maximum speed to a specified position without cutting."
-            },
-            {
-                "question": "What is the primary purpose of coolant in CNC machining?",
-                "options": ["To make the machine run faster", "To reduce heat and remove chips", "To increase tool sharpness", "To reduce machine noise"],
-                "correct": 1,
-                "explanation": "Coolant serves to reduce heat generated during cutting and helps flush away chips from the cutting area."
-            },
-            {
-                "question": "How many axes does a standard 5-axis CNC machine have?",
-                "options": ["3 linear axes only", "2 linear and 3 rotary axes", "3 linear and 2 rotary axes", "5 linear axes"],
-                "correct": 2,
-                "explanation": "A 5-axis CNC machine has 3 linear axes (X, Y, Z) and 2 rotary axes (typically A and B or A and C)."
-            },
-            {
-                "question": "What does CAM software stand for?",
-                "options": ["Computer Aided Machining", "Central Axis Management", "Computer Aided Manufacturing", "Controlled Automation Module"],
-                "correct": 2,
-                "explanation": "CAM stands for Computer Aided Manufacturing, software used to generate toolpaths and G-code from CAD models."
-            }
-        ]
-    },
-    "Project Management Essentials": {
-        "description": "Essential concepts for effective project management",
-        "questions": [
-            {
-                "question": "What does SMART stand for in SMART goals?",
-                "options": ["Strategic, Managed, Achievable, Realistic, Timed", "Specific, Measurable, Achievable, Relevant, Time-bound", "Simple, Meaningful, Actionable, Reasonable, Targeted", "Structured, Monitored, Attainable, Resourced, Tracked"],
-                "correct": 1,
-                "explanation": "SMART goals are Specific, Measurable, Achievable, Relevant, and Time-bound."
-            },
-            {
-                "question": "What are the three constraints in the project management triangle?",
-                "options": ["People, Process, Technology", "Plan, Execute, Monitor", "Scope, Time, Cost", "Quality, Risk, Resources"],
-                "correct": 2,
-                "explanation": "The classic project management triangle consists of Scope, Time, and Cost constraints."
-            },
-            {
-                "question": "Which project management methodology uses sprints?",
-                "options": ["Waterfall", "Agile/Scrum", "Six Sigma", "PRINCE2"],
-                "correct": 1,
-                "explanation": "Agile/Scrum methodology uses sprints, which are fixed-length iterations typically lasting 2-4 weeks."
-            },
-            {
-                "question": "What is a Gantt chart primarily used for?",
-                "options": ["Budget tracking", "Risk assessment", "Schedule visualization", "Quality control"],
-                "correct": 2,
-                "explanation": "A Gantt chart is primarily used for schedule visualization, showing project tasks over time."
-            },
-            {
-                "question": "What does WBS stand for?",
-                "options": ["Work Breakdown Structure", "Weekly Business Summary", "Workflow Balance System", "Working Budget Statement"],
-                "correct": 0,
-                "explanation": "WBS stands for Work Breakdown Structure, a hierarchical decomposition of project deliverables."
-            }
-        ]
-    },
-    "Safety Protocols Quiz": {
-        "description": "Workplace safety and OSHA compliance basics",
-        "questions": [
-            {
-                "question": "What does PPE stand for?",
-                "options": ["Personal Protection Equipment", "Personal Protective Equipment", "Professional Protection Equipment", "Protective Personal Equipment"],
-                "correct": 1,
-                "explanation": "PPE stands for Personal Protective Equipment, which includes items worn to minimize exposure to hazards."
-            },
-            {
-                "question": "What is the purpose of a lockout/tagout procedure?",
-                "options": ["To secure the building", "To prevent unauthorized machine startup during maintenance", "To track tool inventory", "To schedule maintenance"],
-                "correct": 1,
-                "explanation": "Lockout/tagout procedures prevent unexpected machine startup or energy release during servicing and maintenance."
-            },
-            {
-                "question": "What does SDS stand for in workplace safety?",
-                "options": ["Safety Data Sheet", "Standard Documentation System", "Safety Department Standards", "Secure Data Storage"],
-                "correct": 0,
-                "explanation": "SDS stands for Safety Data Sheet, which provides information about chemical hazards and safe handling procedures."
-            },
-            {
-                "question": "What is the recommended lifting technique to prevent back injury?",
-                "options": ["Bend at the waist", "Lift with your legs, not your back", "Twist while lifting", "Hold breath while lifting"],
-                "correct": 1,
-                "explanation": "Proper lifting technique involves bending at the knees and lifting with leg muscles while keeping the back straight."
-            },
-            {
-                "question": "How often should fire extinguishers be inspected?",
-                "options": ["Annually", "Monthly", "Weekly", "Only after use"],
-                "correct": 1,
-                "explanation": "Fire extinguishers should be visually inspected monthly and receive professional maintenance annually."
-            }
-        ]
-    },
-    "Basic Python Programming": {
-        "description": "Fundamental concepts in Python programming",
-        "questions": [
-            {
-                "question": "Which of the following is used to define a function in Python?",
-                "options": ["function", "def", "func", "define"],
-                "correct": 1,
-                "explanation": "The 'def' keyword is used to define a function in Python."
-            },
-            {
-                "question": "What data type is [1, 2, 3] in Python?",
-                "options": ["Tuple", "Set", "List", "Dictionary"],
-                "correct": 2,
-                "explanation": "Square brackets [] denote a list in Python, which is a mutable, ordered collection."
-            },
-            {
-                "question": "Which operator is used for exponentiation in Python?",
-                "options": ["^", "**", "^^", "exp()"],
-                "correct": 1,
-                "explanation": "The ** operator is used for exponentiation in Python (e.g., 2**3 equals 8)."
-            },
-            {
-                "question": "What is the output of print(type(5))?",
-                "options": ["&lt;class 'float'&gt;", "&lt;class 'int'&gt;", "&lt;class 'number'&gt;", "&lt;class 'digit'&gt;"],
-                "correct": 1,
-                "explanation": "The number 5 is an integer, so type(5) returns &lt;class 'int'&gt;."
-            },
-            {
-                "question": "Which statement is used to handle exceptions in Python?",
-                "options": ["try/except", "catch/throw", "error/handle", "test/fail"],
-                "correct": 0,
-                "explanation": "Python uses try/except blocks to handle exceptions and errors in code."
-            }
-        ]
-    }
-}
+@functools.lru_cache(maxsize=None)
+def get_sample_quizzes():
+    """Load the bundled sample quizzes on first use."""
+    try:
+        with open(resource_path('assets/sample_quizzes.json'), 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if orjson else json.loads(data)
+    except Exception as e:
+        logging.error(f"Could not load sample quizzes: {e}")
+        return {}
 
 
 # --- Quiz Generator ---
 
 
-class QuizGenerator:
-    def __init__(self, quiz_title: str = "Interactive Knowledge Quiz", 
-                 quiz_description: str = "Test your knowledge with this interactive quiz."):
-        self.quiz_title = quiz_title
-        self.quiz_description = quiz_description
-        self.questions = []
-
-
-    def add_question(self, question: str, options: List[str], correct_index: int, 
-                     explanation: str = "", image_filename: str = ""):
-        """Add a question to the quiz."""
-        self.questions.append({
-            "question": question,
-            "options": options,
-            "correct": correct_index,
-            "explanation": explanation,
-            "image": image_filename
-        })
-
-
-    def clear_questions(self):
-        """Clear all questions."""
-        self.questions = []
+# Compact encoder for JSON embedded in generated pages
+_SCRIPT_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
 
 
-    def get_question_count(self):
-        """Get number of questions."""
-        return len(self.questions)
+def script_json(value):
+    """Serialize a value as compact JSON that is safe to embed in an inline <script> block."""
+    if orjson:
+        text = orjson.dumps(value).decode('utf-8')
+    else:
+        text = _SCRIPT_JSON_ENCODER.encode(value)
+    # Escaping "</" keeps user text such as "</script>" from closing the block early
+    return text.replace('</', '<\\/')
 
 
-    def load_from_csv(self, csv_file: str):
-        """Load questions from CSV file."""
-        try:
-            with open(csv_file, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                count = 0
-                for row in reader:
-                    question = row.get('question') or row.get('Question')
-                    
-                    options = []
-                    if 'option_a' in row:
-                        options = [row['option_a'], row['option_b'], row['option_c'], row['option_d']]
-                    elif 'Option A' in row:
-                        options = [row['Option A'], row['Option B'], row['Option C'], row['Option D']]
-                    
-                    options = [opt for opt in options if opt and opt.strip()]
-                    
-                    correct_answer = row.get('correct_answer') or row.get('correct') or row.get('answer')
-                    correct_index = self._parse_correct_answer(correct_answer, options)
-                    
-                    explanation = row.get('explanation') or row.get('Explanation') or ""
-                    
-                    if question and options and correct_index is not None:
-                        self.add_question(question, options, correct_index, explanation)
-                        count += 1
-                
-                return True, f"Loaded {count} questions from CSV"
-        except Exception as e:
-            return False, f"Error loading CSV: {str(e)}"
+def iter_script_json(value):
+    """Yield script_json(value) in pieces so large values can be streamed to a file."""
+    if orjson:
+        yield script_json(value)
+        return
+    # iterencode emits every JSON string as a single piece, so "</" is never split
+    for chunk in _SCRIPT_JSON_ENCODER.iterencode(value):
+        yield chunk.replace('</', '<\\/')
 
 
-    def load_from_json(self, json_file: str):
-        """Load questions from JSON file."""
-        try:
-            with open(json_file, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-            
-            if 'title' in data:
-                self.quiz_title = data['title']
-            if 'description' in data:
-                self.quiz_description = data['description']
-            
-            questions = data.get('questions', data if isinstance(data, list) else [])
-            count = 0
-            for q in questions:
-                if all(key in q for key in ['question', 'options', 'correct']):
-                    self.add_question(
-                        question=q['question'],
-                        options=q['options'],
-                        correct_index=q['correct'],
-                        explanation=q.get('explanation', '')
-                    )
-                    count += 1
-            
-            return True, f"Loaded {count} questions from JSON"
-        except Exception as e:
-            return False, f"Error loading JSON: {str(e)}"
+# Answer option letters in the text import format, e.g. "A: Option text"
+_OPTION_LETTERS = frozenset('ABCD')
 
+# Answer letters accepted for the correct option
+_LETTER_TO_INDEX = {'A': 0, 'B': 1, 'C': 2, 'D': 3}
 
-    def load_from_text(self, text_content: str):
-        """Load questions from formatted text."""
-        try:
-            questions_found = 0
-            question_blocks = text_content.split('---')
-            
-            for block in question_blocks:
-                if not block.strip():
-                    continue
-                
-                lines = block.strip().split('\n')
-                question = ""
-                options = []
-                correct_answer = ""
-                explanation = ""
-                
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith('Q:'):
-                        question = line[2:].strip()
-                    elif re.match(r'^[A-D]:', line):
-                        options.append(line[2:].strip())
-                    elif line.startswith('Correct:'):
-                        correct_answer = line[8:].strip()
-                    elif line.startswith('Explanation:'):
-                        explanation = line[12:].strip()
-                
-                if question and options:
-                    correct_index = self._parse_correct_answer(correct_answer, options)
-                    if correct_index is not None:
-                        self.add_question(question, options, correct_index, explanation)
-                        questions_found += 1
-            
-            return True, f"Loaded {questions_found} questions from text"
-        except Exception as e:
-            return False, f"Error parsing text: {str(e)}"
+# Write buffer size for CSV exports
+CSV_WRITE_BUFFER = 64 * 1024
 
+# Write buffer size for generated HTML quizzes
+HTML_WRITE_BUFFER = 64 * 1024
 
-    def _parse_correct_answer(self, correct_answer: str, options: List[str]) -> Optional[int]:
-        """Parse correct answer from various formats."""
-        if not correct_answer:
-            return None
-        
-        correct_answer = str(correct_answer).strip().upper()
-        
-        if correct_answer in ['A', 'B', 'C', 'D']:
-            return ord(correct_answer) - ord('A')
-        
-        try:
-            index = int(correct_answer) - 1
-            if 0 <= index < len(options):
-                return index
-        except ValueError:
-            pass
+# Quiz configuration script embedded in generated HTML quizzes
+QUIZ_CONFIG_TEMPLATE = """
+    <script>
+        // Quiz Configuration
+        const QUIZ_CONFIG = {config_json};
         
-        return None
-
-
-    def save_to_csv(self, output_file: str):
-        """Save questions to CSV."""
-        try:
-            with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['question', 'option_a', 'option_b', 'option_c', 'option_d', 'correct_answer', 'explanation'])
-                
-                for q in self.questions:
-                    options = q['options'] + [''] * (4 - len(q['options']))
-                    correct_letter = chr(65 + q['correct'])
-                    writer.writerow([
-                        q['question'],
-                        options[0],
-                        options[1],
-                        options[2],
-                        options[3],
-                        correct_letter,
-                        q['explanation']
-                    ])
-            
-            return True, f"Saved {len(self.questions)} questions to CSV"
-        except Exception as e:
-            return False, f"Error saving CSV: {str(e)}"
-
-
-    def save_to_json(self, output_file: str):
-        """Save questions to JSON."""
-        try:
-            data = {
-                "title": self.quiz_title,
-                "description": self.quiz_description,
-                "questions": self.questions
-            }
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            return True, f"Saved {len(self.questions)} questions to JSON"
-        except Exception as e:
-            return False, f"Error saving JSON: {str(e)}"
+        let timeRemaining = QUIZ_CONFIG.timerMinutes * 60; // Convert to seconds
+        let timerInterval = null;
+    </script>
+"""
 
 
-    def generate_html(self, output_file: str):
-        """Generate clean HTML quiz file without image instructions."""
-        logging.info(f"Starting HTML generation for: {output_file}")
-        
-        if not self.questions:
-            logging.warning("No questions available for HTML generation")
-            return False, "No questions to generate"
-        
-        try:
-            # Log quiz details
-            logging.info(f"Quiz title: {self.quiz_title}")
-            logging.info(f"Number of questions: {len(self.questions)}")
-            
-            # Try to embed logo as base64 FIRST - before using it
-            logo_base64 = ""
-            logo_path = resource_path('assets/MultiaxisQuizGenerator_logo.png')
-            try:
-                with open(logo_path, 'rb') as f:
-                    logo_data = f.read()
-                    logo_base64 = base64.b64encode(logo_data).decode('utf-8')
-                    logo_base64 = f"data:image/png;base64,{logo_base64}"
-                    logging.info("Logo successfully encoded as base64")
-            except Exception as e:
-                logging.warning(f"Could not load logo: {e}")
-                # Fallback to SVG placeholder
-                logo_base64 = "data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='200' height='80' viewBox='0 0 200 80'%3E%3Crect width='200' height='80' fill='%232C5282'/%3E%3Ctext x='100' y='40' font-family='Arial' font-size='16' fill='white' text-anchor='middle' dominant-baseline='middle'%3EMULTIAXIS%3C/text%3E%3C/svg%3E"
-
-            # Check if any questions have images
-            has_images = any(q.get('image', '') for q in self.questions)
-            logging.info(f"Has images: {has_images}")
-            
-            # Get settings from parent app if available
-            author = getattr(self, 'author', 'Arlo AI Assistant')
-            company = getattr(self, 'company', 'Multiaxis Intelligence')
-            show_results = getattr(self, 'show_results', True)
-            show_explanations = getattr(self, 'show_explanations', True)
-            allow_review = getattr(self, 'allow_review', True)
-            randomize = getattr(self, 'randomize', False)
-            timer_minutes = getattr(self, 'timer_minutes', 0)
-            pass_threshold = getattr(self, 'pass_threshold', 70)
-            enable_certificate = getattr(self, 'enable_certificate', False)
-            
-            logging.debug(f"Settings - Author: {author}, Company: {company}, Timer: {timer_minutes}")
-            
-            # Generate image constants section if needed (but cleaner)
-            image_constants = ""
-            if has_images:
-                logging.info("Generating image constants section")
-                image_constants = """
+@functools.lru_cache(maxsize=64)
+def build_quiz_config(show_results, show_explanations, allow_review, randomize, timer_minutes,
+                      pass_threshold, enable_certificate, author, company, quiz_title):
+    """Render the QUIZ_CONFIG script block, cached per combination of settings."""
+    return QUIZ_CONFIG_TEMPLATE.format(config_json=script_json({
+        'showResults': show_results,
+        'showExplanations': show_explanations,
+        'allowReview': allow_review,
+        'randomizeQuestions': randomize,
+        'timerMinutes': timer_minutes,
+        'passThreshold': pass_threshold,
+        'enableCertificate': enable_certificate,
+        'author': author,
+        'company': company,
+        'quizTitle': quiz_title,
+        'copyright': f"©2025 {company}. All rights reserved"
+    }))
+
+
+@functools.lru_cache(maxsize=64)
+def build_image_constants(image_files):
+    """Render the IMAGE_PATHS script block for a tuple of image file names, cached."""
+    # Identity map kept editable by hand (the answer key explains how)
+    image_paths = json.dumps({img: img for img in image_files}, indent=4, ensure_ascii=False)
+    image_paths = image_paths.replace('\n', '\n        ').replace('</', '<\\/')
+    return """
     <script>
         // Image configuration - see answer key for setup instructions
-        const IMAGE_PATHS = {"""
-                
-                # Collect unique image filenames
-                image_files = set()
-                for i, q in enumerate(self.questions, 1):
-                    if q.get('image'):
-                        image_files.add(q['image'])
-                        logging.debug(f"Question {i} has image: {q['image']}")
-                
-                # Add image path entries
-                for img in sorted(image_files):
-                    image_constants += f'\n            "{img}": "{img}",'
-                
-                image_constants = image_constants.rstrip(',')
-                image_constants += """
-        };
+        const IMAGE_PATHS = """ + image_paths + """;
         
         // Placeholder image
         const PLACEHOLDER_IMAGE = "data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='1024' height='1024' viewBox='0 0 1024 1024'%3E%3Crect width='1024' height='1024' fill='%23f0f0f0'/%3E%3Ctext x='512' y='512' font-family='Arial' font-size='48' fill='%23999' text-anchor='middle' dominant-baseline='middle'%3EImage Loading...%3C/text%3E%3C/svg%3E";
@@ -622,75 +353,43 @@ class QuizGenerator:
         }
     </script>
 """
-            
-            # Quiz configuration script
-            quiz_config = f"""
-    <script>
-        // Quiz Configuration
-        const QUIZ_CONFIG = {{
-            showResults: {str(show_results).lower()},
-            showExplanations: {str(show_explanations).lower()},
-            allowReview: {str(allow_review).lower()},
-            randomizeQuestions: {str(randomize).lower()},
-            timerMinutes: {timer_minutes},
-            passThreshold: {pass_threshold},
-            enableCertificate: {str(enable_certificate).lower()},
-            author: "{author}",
-            company: "{company}",
-            quizTitle: "{self.quiz_title}", 
-            copyright: "©2025 {company}. All rights reserved"
-        }};
-        
-        let timeRemaining = QUIZ_CONFIG.timerMinutes * 60; // Convert to seconds
-        let timerInterval = null;
-    </script>
-"""
-            
-            logging.info("Building HTML template")
-            
-            html_template = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="author" content="{author}">
-    <meta name="company" content="{company}">
-    <meta name="generator" content="Quiz Generator - Multiaxis Intelligence">
-    <title>{title}</title>
-    <style>
-        body {{
+
+
+# Stylesheet for generated quizzes, inlined or written once as a shared file
+QUIZ_CSS = """
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             margin: 0;
             padding: 20px;
             background: linear-gradient(135deg, #5B9BD5 0%, #2C5282 100%);
             min-height: 100vh;
-        }}
-        .quiz-container {{
+        }
+        .quiz-container {
             background: white;
             padding: 30px;
             border-radius: 15px;
             margin: 20px auto;
             max-width: 900px;
             box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-        }}
-        h1 {{
+        }
+        h1 {
             color: #2C5282;
             text-align: center;
             margin-bottom: 10px;
-        }}
-        .quiz-description {{
+        }
+        .quiz-description {
             text-align: center;
             color: #666;
             margin-bottom: 10px;
-        }}
-        .quiz-meta {{
+        }
+        .quiz-meta {
             text-align: center;
             color: #999;
             font-size: 14px;
             margin-bottom: 20px;
-        }}
-        .timer-display {{
+        }
+        .timer-display {
             text-align: center;
             font-size: 24px;
             color: #2C5282;
@@ -700,47 +399,52 @@ class QuizGenerator:
             background: #f0f4ff;
             border-radius: 8px;
             display: none;
-        }}
-        .timer-display.warning {{
+        }
+        .timer-value {
+            display: inline-block;
+            min-width: 80px;
+            font-variant-numeric: tabular-nums;
+        }
+        .timer-display.warning {
             color: #ffc107;
             background: #fff3cd;
-        }}
-        .timer-display.danger {{
+        }
+        .timer-display.danger {
             color: #dc3545;
             background: #f8d7da;
-        }}
-        .quiz-question {{
+        }
+        .quiz-question {
             margin: 20px 0;
             padding: 20px;
             background: #f8f9fa;
             border-radius: 10px;
             border-left: 4px solid #5B9BD5;
-        }}
-        .quiz-question h4 {{
+        }
+        .quiz-question h4 {
             color: #2C5282;
             margin-bottom: 15px;
-        }}
-        .difficulty-badge {{
+        }
+        .difficulty-badge {
             display: inline-block;
             padding: 2px 8px;
             border-radius: 12px;
             font-size: 12px;
             font-weight: bold;
             margin-left: 10px;
-        }}
-        .difficulty-easy {{
+        }
+        .difficulty-easy {
             background: #d4edda;
             color: #155724;
-        }}
-        .difficulty-medium {{
+        }
+        .difficulty-medium {
             background: #fff3cd;
             color: #856404;
-        }}
-        .difficulty-hard {{
+        }
+        .difficulty-hard {
             background: #f8d7da;
             color: #721c24;
-        }}
-        .question-image {{
+        }
+        .question-image {
             width: 100%;
             max-width: 600px;
             height: auto;
@@ -748,11 +452,11 @@ class QuizGenerator:
             display: block;
             border-radius: 8px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .quiz-options {{
+        }
+        .quiz-options {
             margin: 15px 0;
-        }}
-        .quiz-option {{
+        }
+        .quiz-option {
             display: block;
             margin: 10px 0;
             padding: 15px;
@@ -761,18 +465,18 @@ class QuizGenerator:
             border-radius: 8px;
             cursor: pointer;
             transition: all 0.3s;
-        }}
-        .quiz-option:hover {{
+        }
+        .quiz-option:hover {
             background: #f0f4ff;
             border-color: #5B9BD5;
             transform: translateX(5px);
-        }}
-        .quiz-option.selected {{
+        }
+        .quiz-option.selected {
             background: #f0f4ff;
             border-color: #5B9BD5;
             font-weight: 600;
-        }}
-        .quiz-button {{
+        }
+        .quiz-button {
             background: linear-gradient(135deg, #5B9BD5 0%, #2C5282 100%);
             color: white;
             padding: 12px 30px;
@@ -783,81 +487,365 @@ class QuizGenerator:
             cursor: pointer;
             margin: 10px 5px;
             transition: transform 0.2s;
-        }}
-        .quiz-button:hover {{
+        }
+        .quiz-button:hover {
             transform: scale(1.05);
-        }}
-        .quiz-button:disabled {{
+        }
+        .quiz-button:disabled {
             background: #ccc;
             cursor: not-allowed;
             transform: scale(1);
-        }}
-        .quiz-results {{
+        }
+        /* Navigation buttons follow the phase class on their container */
+        .quiz-controls .quiz-button {
+            display: none;
+        }
+        .phase-start #startBtn,
+        .phase-question.can-review:not(.is-first) #prevBtn,
+        .phase-question:not(.is-last) #nextBtn,
+        .phase-question.is-last #submitBtn,
+        .phase-results #restartBtn {
+            display: inline-block;
+        }
+        .quiz-results {
             padding: 30px;
             background: linear-gradient(135deg, #f0f4ff 0%, #e8ecff 100%);
             border-radius: 15px;
             margin: 20px 0;
             display: none;
-        }}
-        .quiz-score {{
+        }
+        .quiz-score {
             font-size: 28px;
             color: #2C5282;
             font-weight: bold;
             text-align: center;
             margin: 20px 0;
-        }}
-        .quiz-progress {{
+        }
+        .quiz-progress {
+            position: relative;
             background: #e2e8f0;
             height: 30px;
             border-radius: 15px;
             overflow: hidden;
             margin: 20px 0;
-        }}
-        .quiz-progress-bar {{
+        }
+        .quiz-progress-bar {
             background: linear-gradient(90deg, #5B9BD5 0%, #2C5282 100%);
             height: 100%;
-            width: 0%;
-            transition: width 0.5s;
+            width: 100%;
+            transform: scaleX(0);
+            transform-origin: left;
+            transition: transform 0.5s;
+        }
+        .quiz-progress-text {
+            position: absolute;
+            inset: 0;
             display: flex;
             align-items: center;
             justify-content: center;
             color: white;
             font-weight: bold;
-        }}
-        .result-item {{
+            text-shadow: 0 0 3px rgba(0,0,0,0.5);
+        }
+        .result-item {
             margin: 15px 0;
             padding: 15px;
             border-radius: 8px;
-        }}
-        .result-item.correct {{
+        }
+        .result-item.correct {
             background: #d4edda;
             border-left: 4px solid #28a745;
-        }}
-        .result-item.incorrect {{
+        }
+        .result-item.incorrect {
             background: #f8d7da;
             border-left: 4px solid #dc3545;
-        }}
-        .certificate-wrapper {{
+        }
+        .certificate-wrapper {
             display: none;
             margin: 30px auto;
             text-align: center;
-        }}
-        .certificate-iframe {{
+        }
+        .certificate-iframe {
             width: 100%;
             height: 900px;
             border: none;
             border-radius: 15px;
             box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-        }}
-        .footer {{
+        }
+        .footer {
             text-align: center;
             margin-top: 30px;
             padding-top: 20px;
             border-top: 1px solid #e2e8f0;
             color: #666;
             font-size: 12px;
+        }
+"""
+
+# Stylesheet as shipped: minified once at import when rcssmin is installed
+QUIZ_CSS_MIN = '\n' + rcssmin.cssmin(QUIZ_CSS) + '\n' if rcssmin else QUIZ_CSS
+
+
+@functools.lru_cache(maxsize=None)
+def quiz_css_filename():
+    """Return the content-hashed file name used for the shared quiz stylesheet."""
+    return f"quiz.{hashlib.sha1(QUIZ_CSS_MIN.encode('utf-8')).hexdigest()[:8]}.css"
+
+
+# Certificate page shown in generated quizzes. {quiz_title}, {author} and {company}
+# are filled in at generation time; the remaining fields are slots the quiz
+# script fills in when a certificate is issued.
+CERTIFICATE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Certificate - {name}</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@700&family=Open+Sans:wght@400;600&display=swap">
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+
+        body {{
+            font-family: 'Open Sans', sans-serif;
+            background: linear-gradient(135deg, #5B9BD5 0%, #2C5282 100%);
+            min-height: 100vh;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            padding: 20px;
+        }}
+
+        .certificate {{
+            max-width: 1100px;
+            width: 95%;
+            min-height: 800px;
+            background: white;
+            border-radius: 20px;
+            box-shadow: 0 30px 60px rgba(0,0,0,0.3);
+            position: relative;
+            padding: 60px;
+            margin: 20px auto;
+            border: 3px solid {sealColor};
+        }}
+
+        .header {{
+            background: linear-gradient(135deg, #2C5282 0%, #5B9BD5 100%);
+            margin: -60px -60px 40px;
+            padding: 40px;
+            text-align: center;
+            border-radius: 17px 17px 0 0;
+        }}
+
+        .logo {{
+            max-width: 200px;
+            height: auto;
+            margin-bottom: 20px;
+        }}
+
+        h1 {{
+            font-family: 'Playfair Display', serif;
+            font-size: 42px;
+            color: white;
+            text-align: center;
+            margin-bottom: 10px;
+        }}
+
+        .recipient {{
+            font-family: 'Playfair Display', serif;
+            font-size: 56px;
+            color: #2C5282;
+            text-align: center;
+            margin: 40px 0;
+            padding-bottom: 20px;
+            border-bottom: 3px solid {sealColor};
+        }}
+
+        .details {{
+            text-align: center;
+            font-size: 20px;
+            line-height: 2;
+            color: #333;
+            margin: 40px 0;
+        }}
+
+        .performance {{
+            background: {sealColor};
+            color: white;
+            padding: 15px 40px;
+            border-radius: 30px;
+            display: inline-block;
+            font-weight: bold;
+            font-size: 20px;
+            margin: 20px 0;
+        }}
+
+        .score {{
+            font-size: 60px;
+            color: {sealColor};
+            font-weight: bold;
+            margin: 20px 0;
+        }}
+
+        .footer {{
+            display: flex;
+            justify-content: space-between;
+            margin-top: 60px;
+            padding-top: 40px;
+            border-top: 2px solid #ddd;
+        }}
+
+        .signature {{
+            text-align: center;
+            flex: 1;
+        }}
+
+        .signature-line {{
+            width: 200px;
+            border-bottom: 2px solid #333;
+            margin: 0 auto 10px;
+            height: 40px;
+        }}
+
+        .meta {{
+            background: #2C5282;
+            color: white;
+            padding: 20px;
+            margin: 60px -60px -60px;
+            border-radius: 0 0 17px 17px;
+            text-align: center;
+        }}
+
+        @media print {{
+            body {{
+                background: white;
+            }}
+            .certificate {{
+                box-shadow: none;
+            }}
         }}
     </style>
+</head>
+<body>
+    <div class="certificate">
+        <div class="header">
+            <img src="{logoUrl}" alt="Company Logo" class="logo">
+            <h1>Certificate of Achievement</h1>
+        </div>
+        <div class="details">This certifies that</div>
+        <div class="recipient">{name}</div>
+        <div class="details">
+            has successfully completed<br>
+            <strong>"{quiz_title}"</strong><br>
+            <div class="performance">{performance}</div><br>
+            <div class="score">{score}%</div>
+        </div>
+        <div class="footer">
+            <div class="signature">
+                <div class="signature-line"></div>
+                <div>{author}</div>
+            </div>
+            <div class="signature">
+                <div class="signature-line"></div>
+                <div>{date}</div>
+            </div>
+            <div class="signature">
+                <div class="signature-line"></div>
+                <div>Michael Kaminski<br>CodeEO, Multiaxis LLC</div>
+            </div>
+        </div>
+        <div class="meta">
+            <div>©2025 {company}. All rights reserved.</div>
+            <div>The Power of MULTIAXIS® with the Intelligence of ARLO™</div>
+            <div style="margin-top: 10px; font-size: 12px;">
+                Certificate ID: {certId}<br>
+                To register this certificate for verification, email this ID along with your name to:<br>
+                <strong>support@multiaxis.llc</strong><br>
+                Once registered, verify at: www.multiaxis.ai/verify
+            </div>
+        </div>
+    </div>
+</body>
+</html>"""
+
+
+def certificate_parts(**fields):
+    """Split CERTIFICATE_TEMPLATE into static text alternating with runtime slot names."""
+    parts = ['']
+    for literal, field, _, _ in string.Formatter().parse(CERTIFICATE_TEMPLATE):
+        parts[-1] += literal
+        if field is None:
+            continue
+        if field in fields:
+            parts[-1] += str(fields[field])
+        else:
+            parts += [field, '']
+    return parts
+
+
+# Certificate script embedded in generated quizzes when certificates are enabled
+CERTIFICATE_SCRIPT_TEMPLATE = """
+        // Certificate markup prepared at generation time: static text alternating with slot names
+        const CERT_PARTS = {cert_parts};
+        
+        // The logo is decoded into a blob URL on first use, so certificates reference it
+        // instead of carrying the whole data URI in every srcdoc
+        const LOGO_DATA = {logo_json};
+        let logoUrl = null;
+        
+        function getLogoUrl() {{
+            if (!logoUrl) {{
+                const comma = LOGO_DATA.indexOf(',');
+                const header = LOGO_DATA.slice(5, comma);
+                const payload = LOGO_DATA.slice(comma + 1);
+                let bytes;
+                if (header.endsWith(';base64')) {{
+                    const binary = atob(payload);
+                    bytes = new Uint8Array(binary.length);
+                    for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+                }} else {{
+                    bytes = new TextEncoder().encode(decodeURIComponent(payload));
+                }}
+                logoUrl = URL.createObjectURL(new Blob([bytes], {{ type: header.split(';')[0] }}));
+            }}
+            return logoUrl;
+        }}
+
+        function generateProfessionalCertificate(name, score, certId) {{
+            const date = new Date().toLocaleDateString('en-US', {{ year: 'numeric', month: 'long', day: 'numeric' }});
+ 
+            let performance = 'Successful Completion';
+            let sealColor = '#5B9BD5';
+   
+            if (score >= 95) {{
+                performance = 'Outstanding Achievement';
+                sealColor = '#FFD700';
+            }} else if (score >= 90) {{
+                performance = 'Excellent Performance';
+                sealColor = '#C0C0C0';
+            }} else if (score >= 80) {{
+                performance = 'Superior Performance';
+                sealColor = '#CD7F32';
+            }}
+    
+            const slots = {{ name, score, certId, performance, sealColor, date, logoUrl: getLogoUrl() }};
+            return CERT_PARTS.map((part, i) => i % 2 ? slots[part] : part).join('');
+        }}
+"""
+
+# Page skeleton for generated quizzes (markup and quiz script), formatted
+# with str.format field syntax
+QUIZ_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta name="author" content="{author}">
+    <meta name="company" content="{company}">
+    <meta name="generator" content="Quiz Generator - Multiaxis Intelligence">
+    <title>{title}</title>
+    {stylesheet}
     {quiz_config}
     {image_constants}
 </head>
@@ -871,27 +859,37 @@ class QuizGenerator:
         </div>
         
         <div class="timer-display" id="timerDisplay">
-            Time Remaining: <span id="timerValue">00:00</span>
+            Time Remaining: <span class="timer-value" id="timerValue">00:00</span>
         </div>
         
         <div class="quiz-progress">
-            <div class="quiz-progress-bar" id="progressBar">0%</div>
+            <div class="quiz-progress-bar" id="progressBar"></div>
+            <div class="quiz-progress-text" id="progressText">0%</div>
         </div>
 
         <div id="quizContent"></div>
 
-        <div style="text-align: center; margin-top: 30px;">
-            <button class="quiz-button" id="prevBtn" onclick="prevQuestion()" style="display:none;">← Previous</button>
-            <button class="quiz-button" id="nextBtn" onclick="nextQuestion()" style="display:none;">Next →</button>
+        <div class="quiz-controls phase-start" id="quizControls" style="text-align: center; margin-top: 30px;">
+            <button class="quiz-button" id="prevBtn" onclick="prevQuestion()">← Previous</button>
+            <button class="quiz-button" id="nextBtn" onclick="nextQuestion()">Next →</button>
             <button class="quiz-button" id="startBtn" onclick="startQuiz()">Start Quiz</button>
-            <button class="quiz-button" id="submitBtn" onclick="submitQuiz()" style="display:none;">Submit Quiz</button>
-            <button class="quiz-button" id="restartBtn" onclick="restartQuiz()" style="display:none;">Restart Quiz</button>
+            <button class="quiz-button" id="submitBtn" onclick="submitQuiz()">Submit Quiz</button>
+            <button class="quiz-button" id="restartBtn" onclick="restartQuiz()">Restart Quiz</button>
         </div>
 
         <div class="quiz-results" id="quizResults">
             <h2 style="text-align: center; color: #2C5282;">Quiz Results</h2>
             <div class="quiz-score" id="quizScore"></div>
             <div id="resultDetails"></div>
+            <template id="resultItemTpl">
+                <div class="result-item">
+                    <strong class="result-head"></strong><br>
+                    <p class="result-question" style="margin: 10px 0;"></p>
+                    <p class="result-answer" style="color: #666;"></p>
+                    <p class="result-correct" style="color: #155724;"></p>
+                    <p class="result-explanation" style="font-style: italic; margin-top: 10px;"></p>
+                </div>
+            </template>
         </div>
         
         <div class="certificate-wrapper" id="certificateWrapper">
@@ -911,17 +909,65 @@ class QuizGenerator:
     <script>
         let quizQuestions = {questions_json};
         let currentQuestion = 0;
-        let userAnswers = [];
+        let userAnswers = [];  // Int32Array per attempt, -1 = unanswered
+        let correctKey = [];
         let quizStarted = false;
+        let timerState = 'normal';  // 'normal' | 'warning' | 'danger'
+        let questionNodes = [];  // built on first visit, then reused
+        let optionNodes = [];
+        let shownNode = null;
+        
+        const OPTION_LETTERS = Object.freeze('ABCDEFGHIJKLMNOPQRSTUVWXYZ'.split(''));
+        
+        // Element handles looked up once; this script runs after the markup it uses
+        const els = {{}};
+        [
+            'timerDisplay', 'timerValue', 'progressBar', 'progressText', 'quizContent', 'quizResults',
+            'quizScore', 'resultDetails', 'resultItemTpl', 'certificateWrapper', 'certificateFrame',
+            'quizControls'
+        ].forEach(id => {{
+            els[id] = document.getElementById(id);
+        }});
+        
+        // Which buttons show is decided by CSS from one class string per phase
+        const CONTROLS_CLASS = 'quiz-controls' + (QUIZ_CONFIG.allowReview ? ' can-review' : '');
+        function setControlsPhase(phase) {{
+            els.quizControls.className = `${{CONTROLS_CLASS}} ${{phase}}`;
+        }}
+        
+        // One delegated listener serves every answer option
+        els.quizContent.addEventListener('click', event => {{
+            const option = event.target.closest('.quiz-option');
+            if (option) selectAnswer(Number(option.dataset.idx));
+        }});
+        
+        // Queue style writes so a navigation touches layout once per frame
+        const pendingWrites = [];
+        function scheduleWrite(fn) {{
+            if (!pendingWrites.length) {{
+                requestAnimationFrame(() => {{
+                    const writes = pendingWrites.splice(0);
+                    writes.forEach(write => write());
+                }});
+            }}
+            pendingWrites.push(fn);
+        }}
         
-        // Apply randomization if configured
+        // Apply randomization if configured (Fisher-Yates: unbiased and linear)
         if (QUIZ_CONFIG.randomizeQuestions) {{
-            quizQuestions = quizQuestions.sort(() => Math.random() - 0.5);
+            for (let i = quizQuestions.length - 1; i > 0; i--) {{
+                const j = Math.floor(Math.random() * (i + 1));
+                [quizQuestions[i], quizQuestions[j]] = [quizQuestions[j], quizQuestions[i]];
+            }}
         }}
         
+        // Results per answer set, so a retake with the same answers is not rebuilt;
+        // the question order above is fixed for the page's lifetime
+        const resultsCache = new Map();
+        
         function startTimer() {{
             if (QUIZ_CONFIG.timerMinutes > 0) {{
-                document.getElementById('timerDisplay').style.display = 'block';
+                els.timerDisplay.style.display = 'block';
                 updateTimerDisplay();
                 
                 timerInterval = setInterval(() => {{
@@ -938,85 +984,135 @@ class QuizGenerator:
         }}
         
         function updateTimerDisplay() {{
+            // Touch the classes only when a threshold is crossed (or a restart resets it)
+            const state = timeRemaining < 60 ? 'danger' : timeRemaining < 300 ? 'warning' : 'normal';
+            if (state !== timerState) {{
+                els.timerDisplay.classList.remove('warning', 'danger');
+                if (state !== 'normal') els.timerDisplay.classList.add(state);
+                timerState = state;
+            }}
+            
+            // A background tab skips the text; the next visible tick catches up
+            if (document.visibilityState !== 'visible') return;
+            
             const minutes = Math.floor(timeRemaining / 60);
             const seconds = timeRemaining % 60;
             const display = `${{String(minutes).padStart(2, '0')}}:${{String(seconds).padStart(2, '0')}}`;
-            document.getElementById('timerValue').textContent = display;
             
-            const timerDiv = document.getElementById('timerDisplay');
-            if (timeRemaining < 60) {{
-                timerDiv.classList.add('danger');
-            }} else if (timeRemaining < 300) {{
-                timerDiv.classList.add('warning');
-            }}
+            // Skip the DOM entirely when this tick renders the same text
+            if (els.timerValue.dataset.last === display) return;
+            els.timerValue.dataset.last = display;
+            els.timerValue.textContent = display;
         }}
 
         function startQuiz() {{
             quizStarted = true;
             currentQuestion = 0;
-            userAnswers = new Array(quizQuestions.length).fill(null);
-            document.getElementById('startBtn').style.display = 'none';
-            document.getElementById('nextBtn').style.display = 'inline-block';
-            document.getElementById('quizResults').style.display = 'none';
-            document.getElementById('certificateWrapper').style.display = 'none';
+            userAnswers = new Int32Array(quizQuestions.length).fill(-1);
+            correctKey = Int32Array.from(quizQuestions, question => question.correct);
+            els.quizResults.style.display = 'none';
+            els.certificateWrapper.style.display = 'none';
+            resetQuestionNodes();
             startTimer();
             showQuestion();
         }}
 
-        function showQuestion() {{
-            const question = quizQuestions[currentQuestion];
-            const quizContent = document.getElementById('quizContent');
+        // Questions are rendered lazily: a large bank only pays for the ones visited
+        function resetQuestionNodes() {{
+            questionNodes = new Array(quizQuestions.length);
+            optionNodes = new Array(quizQuestions.length);
+            shownNode = null;
+            els.quizContent.replaceChildren();
+        }}
+
+        // Build one question's DOM detached, then attach it in a single insert
+        function buildQuestion(qIndex) {{
+            const question = quizQuestions[qIndex];
+            const node = document.createElement('div');
+            node.className = 'quiz-question';
+            node.style.display = 'none';
             
-            let difficultyBadge = '';
+            const heading = document.createElement('h4');
+            heading.textContent = `Question ${{qIndex + 1}} of ${{quizQuestions.length}} `;
             if (question.difficulty) {{
-                const diffClass = `difficulty-${{question.difficulty.toLowerCase()}}`;
-                difficultyBadge = `<span class="difficulty-badge ${{diffClass}}">${{question.difficulty}}</span>`;
+                const badge = document.createElement('span');
+                badge.className = `difficulty-badge difficulty-${{question.difficulty.toLowerCase()}}`;
+                badge.textContent = question.difficulty;
+                heading.appendChild(badge);
             }}
+            node.appendChild(heading);
             
-            let html = `
-                <div class="quiz-question">
-                    <h4>Question ${{currentQuestion + 1}} of ${{quizQuestions.length}} ${{difficultyBadge}}</h4>
-                    <p style="font-size: 18px; margin: 20px 0;">${{question.question}}</p>
-            `;
+            const text = document.createElement('p');
+            text.style.cssText = 'font-size: 18px; margin: 20px 0;';
+            text.innerHTML = question.question;
+            node.appendChild(text);
             
             // Add image if present
             if (question.image) {{
-                const imagePath = typeof getImagePath === 'function' ? getImagePath(question.image) : question.image;
-                html += `<img src="${{imagePath}}" alt="Question ${{currentQuestion + 1}} Image" class="question-image" onerror="this.src='${{typeof PLACEHOLDER_IMAGE !== 'undefined' ? PLACEHOLDER_IMAGE : ''}}'">`;
+                const img = document.createElement('img');
+                img.className = 'question-image';
+                img.alt = `Question ${{qIndex + 1}} Image`;
+                img.loading = 'lazy';
+                if (typeof PLACEHOLDER_IMAGE !== 'undefined') {{
+                    img.onerror = () => {{
+                        img.onerror = null;
+                        img.src = PLACEHOLDER_IMAGE;
+                    }};
+                }}
+                img.src = typeof getImagePath === 'function' ? getImagePath(question.image) : question.image;
+                node.appendChild(img);
             }}
             
-            html += '<div class="quiz-options">';
-            
-            question.options.forEach((option, index) => {{
-                const isSelected = userAnswers[currentQuestion] === index;
-                html += `
-                    <label class="quiz-option ${{isSelected ? 'selected' : ''}}" onclick="selectAnswer(${{index}})">
-                        <input type="radio" name="q${{currentQuestion}}" value="${{index}}" 
-                            ${{isSelected ? 'checked' : ''}} style="margin-right: 10px;">
-                        ${{String.fromCharCode(65 + index)}}) ${{option}}
-                    </label>
-                `;
+            const options = document.createElement('div');
+            options.className = 'quiz-options';
+            optionNodes[qIndex] = question.options.map((option, index) => {{
+                const label = document.createElement('label');
+                label.className = 'quiz-option';
+                label.dataset.idx = index;
+                
+                const input = document.createElement('input');
+                input.type = 'radio';
+                input.name = `q${{qIndex}}`;
+                input.value = index;
+                input.style.marginRight = '10px';
+                label.appendChild(input);
+                label.insertAdjacentHTML('beforeend', `${{OPTION_LETTERS[index]}}) ${{option}}`);
+                
+                options.appendChild(label);
+                return label;
             }});
+            node.appendChild(options);
             
-            html += '</div></div>';
-            quizContent.innerHTML = html;
+            els.quizContent.appendChild(node);
+            questionNodes[qIndex] = node;
+            return node;
+        }}
+
+        function showQuestion() {{
+            const node = questionNodes[currentQuestion] || buildQuestion(currentQuestion);
+            if (node !== shownNode) {{
+                if (shownNode) shownNode.style.display = 'none';
+                node.style.display = 'block';
+                shownNode = node;
+            }}
             
             // Update navigation buttons
-            if (QUIZ_CONFIG.allowReview) {{
-                document.getElementById('prevBtn').style.display = currentQuestion > 0 ? 'inline-block' : 'none';
-            }}
-            document.getElementById('nextBtn').style.display = currentQuestion < quizQuestions.length - 1 ? 'inline-block' : 'none';
-            document.getElementById('submitBtn').style.display = currentQuestion === quizQuestions.length - 1 ? 'inline-block' : 'none';
+            const isFirst = currentQuestion === 0;
+            const isLast = currentQuestion === quizQuestions.length - 1;
+            const phase = 'phase-question' + (isFirst ? ' is-first' : '') + (isLast ? ' is-last' : '');
+            scheduleWrite(() => setControlsPhase(phase));
             
             updateProgress();
         }}
 
         function selectAnswer(index) {{
+            // Only the previously selected option and the new one change
+            const options = optionNodes[currentQuestion];
+            const previous = userAnswers[currentQuestion];
+            if (previous === index) return;
+            if (previous >= 0) options[previous].classList.remove('selected');
+            options[index].classList.add('selected');
             userAnswers[currentQuestion] = index;
-            const options = document.querySelectorAll('.quiz-option');
-            options.forEach((option, i) => {{
-                option.classList.toggle('selected', i === index);
-            }});
         }}
 
         function nextQuestion() {{
@@ -1034,10 +1130,62 @@ class QuizGenerator:
         }}
 
         function updateProgress() {{
-            const progress = ((currentQuestion + 1) / quizQuestions.length) * 100;
-            const progressBar = document.getElementById('progressBar');
-            progressBar.style.width = progress + '%';
-            progressBar.textContent = Math.round(progress) + '%';
+            // Scaling (not resizing) the bar keeps the animation off the layout path
+            const progress = (currentQuestion + 1) / quizQuestions.length;
+            scheduleWrite(() => {{
+                els.progressBar.style.transform = `scaleX(${{progress}})`;
+                els.progressText.textContent = Math.round(progress * 100) + '%';
+            }});
+        }}
+
+        function getResults() {{
+            const key = userAnswers.join(',');
+            const cached = resultsCache.get(key);
+            if (cached) return cached;
+            
+            // Score with a plain integer loop, then build the report separately
+            let correct = 0;
+            for (let i = 0; i < correctKey.length; i++) {{
+                if (userAnswers[i] === correctKey[i]) correct++;
+            }}
+            
+            // Clone one result item per question into a detached container; only the
+            // question and option text (which may hold markup) is parsed as HTML
+            const details = document.createElement('div');
+            details.style.marginTop = '20px';
+            const itemTemplate = els.resultItemTpl.content.firstElementChild;
+            
+            quizQuestions.forEach((question, index) => {{
+                const userAnswer = userAnswers[index];
+                const isCorrect = userAnswer === correctKey[index];
+                const item = itemTemplate.cloneNode(true);
+                
+                item.classList.add(isCorrect ? 'correct' : 'incorrect');
+                item.querySelector('.result-head').textContent = `Q${{index + 1}}: ${{isCorrect ? '✓ Correct' : '✗ Incorrect'}}`;
+                item.querySelector('.result-question').innerHTML = question.question;
+                item.querySelector('.result-answer').innerHTML =
+                    `Your answer: ${{userAnswer >= 0 ? question.options[userAnswer] : 'Not answered'}}`;
+                
+                const correctLine = item.querySelector('.result-correct');
+                if (isCorrect) {{
+                    correctLine.remove();
+                }} else {{
+                    correctLine.innerHTML = `Correct answer: ${{question.options[question.correct]}}`;
+                }}
+                
+                const explanation = item.querySelector('.result-explanation');
+                if (QUIZ_CONFIG.showExplanations && question.explanation) {{
+                    explanation.innerHTML = question.explanation;
+                }} else {{
+                    explanation.remove();
+                }}
+                
+                details.appendChild(item);
+            }});
+            
+            const result = {{ correct, details }};
+            resultsCache.set(key, result);
+            return result;
         }}
 
         function submitQuiz() {{
@@ -1051,27 +1199,8 @@ class QuizGenerator:
                 return;
             }}
             
-            let correct = 0;
-            let resultHTML = '<div style="margin-top: 20px;">';
-            
-            quizQuestions.forEach((question, index) => {{
-                const userAnswer = userAnswers[index];
-                const isCorrect = userAnswer === question.correct;
-                if (isCorrect) correct++;
-                
-                resultHTML += `
-                    <div class="result-item ${{isCorrect ? 'correct' : 'incorrect'}}">
-                        <strong>Q${{index + 1}}: ${{isCorrect ? '✓ Correct' : '✗ Incorrect'}}</strong><br>
-                        <p style="margin: 10px 0;">${{question.question}}</p>
-                        <p style="color: #666;">Your answer: ${{userAnswer !== null ? question.options[userAnswer] : 'Not answered'}}</p>
-                        ${{!isCorrect ? `<p style="color: #155724;">Correct answer: ${{question.options[question.correct]}}</p>` : ''}}
-                        ${{QUIZ_CONFIG.showExplanations && question.explanation ? `<p style="font-style: italic; margin-top: 10px;">${{question.explanation}}</p>` : ''}}
-                    </div>
-                `;
-            }});
-            
-            resultHTML += '</div>';
-            
+            const result = getResults();
+            const correct = result.correct;
             const percentage = Math.round((correct / quizQuestions.length) * 100);
             const passed = percentage >= QUIZ_CONFIG.passThreshold;
             
@@ -1079,1839 +1208,501 @@ class QuizGenerator:
             let color = '';
             
             if (percentage >= 90) {{
-                feedback = '🎉 Outstanding!';
-                color = '#28a745';
-            }} else if (percentage >= 80) {{
-                feedback = '🎉 Excellent work!';
-                color = '#28a745';
-            }} else if (percentage >= QUIZ_CONFIG.passThreshold) {{
-                feedback = '👍 Good job! You passed!';
-                color = '#ffc107';
-            }} else {{
-                feedback = '📚 Keep studying and try again!';
-                color = '#dc3545';
-            }}
-            
-            document.getElementById('quizScore').innerHTML = `
-                <div style="font-size: 48px; margin: 20px 0;">${{percentage}}%</div>
-                <div>You scored ${{correct}} out of ${{quizQuestions.length}}</div>
-                <div style="font-size: 20px; color: ${{color}}; margin-top: 15px;">${{feedback}}</div>
-                <div style="margin-top: 10px; font-size: 16px;">
-                    Pass Threshold: ${{QUIZ_CONFIG.passThreshold}}% - 
-                    <strong>${{passed ? 'PASSED ✓' : 'NOT PASSED ✗'}}</strong>
-                </div>
-            `;
-            document.getElementById('resultDetails').innerHTML = resultHTML;
-
-            // Show certificate if enabled and passed
-            if (QUIZ_CONFIG.enableCertificate && passed) {{
-                const userName = prompt('Congratulations! Enter your name for the certificate:') || 'Participant';
-    
-                // Generate certificate ID here
-                const timestamp = Date.now().toString();
-                const random = Math.random().toString(36).substr(2, 4).toUpperCase();
-                const certData = userName + QUIZ_CONFIG.quizTitle + percentage + timestamp + random;
-                const certId = btoa(certData).replace(/[^A-Z0-9]/gi, '').substr(0, 12).toUpperCase();
-    
-                // Pass certId to the function
-                const certHTML = generateProfessionalCertificate(userName, percentage, certId);
-    
-                const iframe = document.getElementById('certificateFrame');
-                iframe.srcdoc = certHTML;
-                document.getElementById('certificateWrapper').style.display = 'block';
-            }}
-            
-            document.getElementById('quizContent').style.display = 'none';
-            document.getElementById('quizResults').style.display = 'block';
-            document.getElementById('submitBtn').style.display = 'none';
-            document.getElementById('nextBtn').style.display = 'none';
-            document.getElementById('prevBtn').style.display = 'none';
-            document.getElementById('restartBtn').style.display = 'inline-block';
-            document.getElementById('timerDisplay').style.display = 'none';
-            
-            document.getElementById('progressBar').style.width = '100%';
-            document.getElementById('progressBar').textContent = '100%';
-        }} 
-
-        function generateProfessionalCertificate(name, score, certId) {{
-            const date = new Date().toLocaleDateString('en-US', {{ year: 'numeric', month: 'long', day: 'numeric' }});
- 
-            let performance = 'Successful Completion';
-            let sealColor = '#5B9BD5';
-   
-            if (score >= 95) {{
-                performance = 'Outstanding Achievement';
-                sealColor = '#FFD700';
-            }} else if (score >= 90) {{
-                performance = 'Excellent Performance';
-                sealColor = '#C0C0C0';
-            }} else if (score >= 80) {{
-                performance = 'Superior Performance';
-                sealColor = '#CD7F32';
-            }}
-    
-            // Try to use logo if available, otherwise use placeholder
-            const logoData = "{logo_base64}";
-    
-            return `<!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Certificate - ${{name}}</title>
-            <style>
-                @import url('https://fonts.googleapis.com/css2?family=Playfair+Display:wght@700&family=Open+Sans:wght@400;600&display=swap');
-        
-                * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        
-                body {{
-                    font-family: 'Open Sans', sans-serif;
-                    background: linear-gradient(135deg, #5B9BD5 0%, #2C5282 100%);
-                    min-height: 100vh;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    padding: 20px;
-                }}
-        
-                .certificate {{
-                    max-width: 1100px;
-                    width: 95%;
-                    min-height: 800px;
-                    background: white;
-                    border-radius: 20px;
-                    box-shadow: 0 30px 60px rgba(0,0,0,0.3);
-                    position: relative;
-                    padding: 60px;
-                    margin: 20px auto;
-                    border: 3px solid ${{sealColor}};
-                }}
-        
-                .header {{
-                    background: linear-gradient(135deg, #2C5282 0%, #5B9BD5 100%);
-                    margin: -60px -60px 40px;
-                    padding: 40px;
-                    text-align: center;
-                    border-radius: 17px 17px 0 0;
-                }}
-        
-                .logo {{
-                    max-width: 200px;
-                    height: auto;
-                    margin-bottom: 20px;
-                }}
-        
-                h1 {{
-                    font-family: 'Playfair Display', serif;
-                    font-size: 42px;
-                    color: white;
-                    text-align: center;
-                    margin-bottom: 10px;
-                }}
-        
-                .recipient {{
-                    font-family: 'Playfair Display', serif;
-                    font-size: 56px;
-                    color: #2C5282;
-                    text-align: center;
-                    margin: 40px 0;
-                    padding-bottom: 20px;
-                    border-bottom: 3px solid ${{sealColor}};
-                }}
-        
-                .details {{
-                    text-align: center;
-                    font-size: 20px;
-                    line-height: 2;
-                    color: #333;
-                    margin: 40px 0;
-                }}
-        
-                .performance {{
-                    background: ${{sealColor}};
-                    color: white;
-                    padding: 15px 40px;
-                    border-radius: 30px;
-                    display: inline-block;
-                    font-weight: bold;
-                    font-size: 20px;
-                    margin: 20px 0;
-                }}
-        
-                .score {{
-                    font-size: 60px;
-                    color: ${{sealColor}};
-                    font-weight: bold;
-                    margin: 20px 0;
-                }}
-        
-                .footer {{
-                    display: flex;
-                    justify-content: space-between;
-                    margin-top: 60px;
-                    padding-top: 40px;
-                    border-top: 2px solid #ddd;
-                }}
-        
-                .signature {{
-                    text-align: center;
-                    flex: 1;
-                }}
-        
-                .signature-line {{
-                    width: 200px;
-                    border-bottom: 2px solid #333;
-                    margin: 0 auto 10px;
-                    height: 40px;
-                }}
-        
-                .meta {{
-                    background: #2C5282;
-                    color: white;
-                    padding: 20px;
-                    margin: 60px -60px -60px;
-                    border-radius: 0 0 17px 17px;
-                    text-align: center;
-                }}
-        
-                @media print {{
-                    body {{
-                        background: white;
-                    }}
-                    .certificate {{
-                        box-shadow: none;
-                    }}
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="certificate">
-                <div class="header">
-                    <img src="${{logoData}}" alt="Company Logo" class="logo">
-                    <h1>Certificate of Achievement</h1>
-                </div>
-                <div class="details">This certifies that</div>
-                <div class="recipient">${{name}}</div>
-                <div class="details">
-                    has successfully completed<br>
-                    <strong>"${{QUIZ_CONFIG.quizTitle || 'Professional Assessment'}}"</strong><br>
-                    <div class="performance">${{performance}}</div><br>
-                    <div class="score">${{score}}%</div>
-                </div>
-                <div class="footer">
-                    <div class="signature">
-                        <div class="signature-line"></div>
-                        <div>${{QUIZ_CONFIG.author || 'Instructor'}}</div>
-                    </div>
-                    <div class="signature">
-                        <div class="signature-line"></div>
-                        <div>${{date}}</div>
-                    </div>
-                    <div class="signature">
-                        <div class="signature-line"></div>
-                        <div>Michael Kaminski<br>CodeEO, Multiaxis LLC</div>
-                    </div>
-                </div>
-                <div class="meta">
-                    <div>©2025 ${{QUIZ_CONFIG.company}}. All rights reserved.</div>
-                    <div>The Power of MULTIAXIS® with the Intelligence of ARLO™</div>
-                    <div style="margin-top: 10px; font-size: 12px;">
-                        Certificate ID: ${{certId}}<br>
-                        To register this certificate for verification, email this ID along with your name to:<br>
-                        <strong>support@multiaxis.llc</strong><br>
-                        Once registered, verify at: www.multiaxis.ai/verify
-                    </div>
-                </div>
-            </div>
-        </body>
-        </html>`;
-        }}
-
-        function downloadCertificate() {{
-            const iframe = document.getElementById('certificateFrame');
-            const iframeDoc = iframe.contentDocument || iframe.contentWindow.document;
-            const certificateHTML = iframeDoc.documentElement.outerHTML;
-    
-            const blob = new Blob([certificateHTML], {{type: 'text/html;charset=utf-8'}});
-            const url = URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = `certificate_${{Date.now()}}.html`;
-            document.body.appendChild(a);
-            a.click();
-            document.body.removeChild(a);
-            URL.revokeObjectURL(url);
-        }}
-
-        function printCertificate() {{
-            const iframe = document.getElementById('certificateFrame');
-            iframe.contentWindow.print();
-        }}
-            
-        function restartQuiz() {{
-            currentQuestion = 0;
-            userAnswers = [];
-            timeRemaining = QUIZ_CONFIG.timerMinutes * 60;
-            document.getElementById('quizContent').style.display = 'block';
-            document.getElementById('quizResults').style.display = 'none';
-            document.getElementById('certificateWrapper').style.display = 'none';
-            document.getElementById('restartBtn').style.display = 'none';
-            startQuiz();
-        }}
-    </script>
-</body>
-</html>'''
-            
-            # Format author and company lines
-            author_line = f"Created by: {author}" if author else ""
-            company_line = f"Organization: {company}" if company else ""
-            footer_text = f"©2025 {company}. All rights reserved | Generated with Quiz Generator - Multiaxis Intelligence"
-            
-            logging.info("Formatting HTML with template values")
-            
-            # Safely convert questions to JSON
-            try:
-                questions_json = json.dumps(self.questions)
-                logging.debug(f"Questions JSON generated, length: {len(questions_json)}")
-            except Exception as e:
-                logging.error(f"Error converting questions to JSON: {e}")
-                logging.error(f"Questions data: {self.questions}")
-                raise
-            
-            formatted_html = html_template.format(
-                title=self.quiz_title,
-                logo_base64=logo_base64,
-                description=self.quiz_description,
-                author=author,
-                company=company,
-                author_line=author_line,
-                company_line=company_line,
-                footer_text=footer_text,
-                questions_json=questions_json,
-                quiz_config=quiz_config,
-                image_constants=image_constants if has_images else ""
-            )
-            
-            logging.info(f"Writing HTML to file: {output_file}")
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(formatted_html)
-            
-            msg = f"Generated clean HTML quiz with {len(self.questions)} questions"
-            if has_images:
-                msg += "\n⚠️ See answer key file for image setup instructions"
-            
-            logging.info(f"HTML generation successful: {msg}")
-            return True, msg
-            
-        except Exception as e:
-            error_msg = f"Error generating HTML: {str(e)}"
-            logging.error(error_msg)
-            logging.error(traceback.format_exc())
-            return False, error_msg
-        """Generate clean HTML quiz file without image instructions."""
-        if not self.questions:
-            return False, "No questions to generate"
-        
-        try:
-            # Check if any questions have images
-            has_images = any(q.get('image', '') for q in self.questions)
-            
-            # Get settings from parent app if available
-            author = getattr(self, 'author', '')
-            company = getattr(self, 'company', 'Multiaxis Intelligence')
-            show_results = getattr(self, 'show_results', True)
-            show_explanations = getattr(self, 'show_explanations', True)
-            allow_review = getattr(self, 'allow_review', True)
-            randomize = getattr(self, 'randomize', False)
-            timer_minutes = getattr(self, 'timer_minutes', 0)
-            pass_threshold = getattr(self, 'pass_threshold', 70)
-            enable_certificate = getattr(self, 'enable_certificate', False)
-            
-            # Generate image constants section if needed (but cleaner)
-            image_constants = ""
-            if has_images:
-                image_constants = """
-    <script>
-        // Image configuration - see answer key for setup instructions
-        const IMAGE_PATHS = {"""
-                
-                # Collect unique image filenames
-                image_files = set()
-                for i, q in enumerate(self.questions, 1):
-                    if q.get('image'):
-                        image_files.add(q['image'])
-                
-                # Add image path entries
-                for img in sorted(image_files):
-                    image_constants += f'\n            "{img}": "{img}",'
-                
-                image_constants = image_constants.rstrip(',')
-                image_constants += """
-        };
-        
-        // Placeholder image
-        const PLACEHOLDER_IMAGE = "data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='1024' height='1024' viewBox='0 0 1024 1024'%3E%3Crect width='1024' height='1024' fill='%23f0f0f0'/%3E%3Ctext x='512' y='512' font-family='Arial' font-size='48' fill='%23999' text-anchor='middle' dominant-baseline='middle'%3EImage Loading...%3C/text%3E%3C/svg%3E";
-        
-        function getImagePath(filename) {
-            return IMAGE_PATHS[filename] || PLACEHOLDER_IMAGE;
-        }
-    </script>
-"""
-            
-            # Quiz configuration script
-            quiz_config = f"""
-    <script>
-        // Quiz Configuration
-        const QUIZ_CONFIG = {{
-            showResults: {str(show_results).lower()},
-            showExplanations: {str(show_explanations).lower()},
-            allowReview: {str(allow_review).lower()},
-            randomizeQuestions: {str(randomize).lower()},
-            timerMinutes: {timer_minutes},
-            passThreshold: {pass_threshold},
-            enableCertificate: {str(enable_certificate).lower()},
-            author: "{author}",
-            company: "{company}",
-            quizTitle: "{self.quiz_title}", 
-            copyright: "©2025 {company}. All rights reserved"
-        }};
-        
-        let timeRemaining = QUIZ_CONFIG.timerMinutes * 60; // Convert to seconds
-        let timerInterval = null;
-    </script>
-"""
-            
-            html_template = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="author" content="{author}">
-    <meta name="company" content="{company}">
-    <meta name="generator" content="Quiz Generator - Multiaxis Intelligence">
-    <title>{title}</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-            background: linear-gradient(135deg, #5B9BD5 0%, #2C5282 100%);
-            min-height: 100vh;
-        }}
-        .quiz-container {{
-            background: white;
-            padding: 30px;
-            border-radius: 15px;
-            margin: 20px auto;
-            max-width: 900px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-        }}
-        h1 {{
-            color: #2C5282;
-            text-align: center;
-            margin-bottom: 10px;
-        }}
-        .quiz-description {{
-            text-align: center;
-            color: #666;
-            margin-bottom: 10px;
-        }}
-        .quiz-meta {{
-            text-align: center;
-            color: #999;
-            font-size: 14px;
-            margin-bottom: 20px;
-        }}
-        .timer-display {{
-            text-align: center;
-            font-size: 24px;
-            color: #2C5282;
-            font-weight: bold;
-            margin: 15px 0;
-            padding: 10px;
-            background: #f0f4ff;
-            border-radius: 8px;
-            display: none;
-        }}
-        .timer-display.warning {{
-            color: #ffc107;
-            background: #fff3cd;
-        }}
-        .timer-display.danger {{
-            color: #dc3545;
-            background: #f8d7da;
-        }}
-        .quiz-question {{
-            margin: 20px 0;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 10px;
-            border-left: 4px solid #5B9BD5;
-        }}
-        .quiz-question h4 {{
-            color: #2C5282;
-            margin-bottom: 15px;
-        }}
-        .difficulty-badge {{
-            display: inline-block;
-            padding: 2px 8px;
-            border-radius: 12px;
-            font-size: 12px;
-            font-weight: bold;
-            margin-left: 10px;
-        }}
-        .difficulty-easy {{
-            background: #d4edda;
-            color: #155724;
-        }}
-        .difficulty-medium {{
-            background: #fff3cd;
-            color: #856404;
-        }}
-        .difficulty-hard {{
-            background: #f8d7da;
-            color: #721c24;
-        }}
-        .question-image {{
-            width: 100%;
-            max-width: 600px;
-            height: auto;
-            margin: 20px auto;
-            display: block;
-            border-radius: 8px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .quiz-options {{
-            margin: 15px 0;
-        }}
-        .quiz-option {{
-            display: block;
-            margin: 10px 0;
-            padding: 15px;
-            background: white;
-            border: 2px solid #e2e8f0;
-            border-radius: 8px;
-            cursor: pointer;
-            transition: all 0.3s;
-        }}
-        .quiz-option:hover {{
-            background: #f0f4ff;
-            border-color: #5B9BD5;
-            transform: translateX(5px);
-        }}
-        .quiz-option.selected {{
-            background: #f0f4ff;
-            border-color: #5B9BD5;
-            font-weight: 600;
-        }}
-        .quiz-button {{
-            background: linear-gradient(135deg, #5B9BD5 0%, #2C5282 100%);
-            color: white;
-            padding: 12px 30px;
-            border: none;
-            border-radius: 25px;
-            font-size: 16px;
-            font-weight: 600;
-            cursor: pointer;
-            margin: 10px 5px;
-            transition: transform 0.2s;
-        }}
-        .quiz-button:hover {{
-            transform: scale(1.05);
-        }}
-        .quiz-button:disabled {{
-            background: #ccc;
-            cursor: not-allowed;
-            transform: scale(1);
-        }}
-        .quiz-results {{
-            padding: 30px;
-            background: linear-gradient(135deg, #f0f4ff 0%, #e8ecff 100%);
-            border-radius: 15px;
-            margin: 20px 0;
-            display: none;
-        }}
-        .quiz-score {{
-            font-size: 28px;
-            color: #2C5282;
-            font-weight: bold;
-            text-align: center;
-            margin: 20px 0;
-        }}
-        .quiz-progress {{
-            background: #e2e8f0;
-            height: 30px;
-            border-radius: 15px;
-            overflow: hidden;
-            margin: 20px 0;
-        }}
-        .quiz-progress-bar {{
-            background: linear-gradient(90deg, #5B9BD5 0%, #2C5282 100%);
-            height: 100%;
-            width: 0%;
-            transition: width 0.5s;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: bold;
-        }}
-        .result-item {{
-            margin: 15px 0;
-            padding: 15px;
-            border-radius: 8px;
-        }}
-        .result-item.correct {{
-            background: #d4edda;
-            border-left: 4px solid #28a745;
-        }}
-        .result-item.incorrect {{
-            background: #f8d7da;
-            border-left: 4px solid #dc3545;
-        }}
-        .certificate {{
-            background: linear-gradient(135deg, #ffd700 0%, #ffed4e 100%);
-            border: 3px solid #ffd700;
-            border-radius: 15px;
-            padding: 40px;
-            margin: 30px auto;
-            max-width: 600px;
-            text-align: center;
-            display: none;
-        }}
-        .certificate h2 {{
-            color: #2C5282;
-            margin-bottom: 20px;
-        }}
-        .certificate-name {{
-            font-size: 28px;
-            font-weight: bold;
-            color: #2C5282;
-            margin: 20px 0;
-        }}
-        .certificate-score {{
-            font-size: 24px;
-            color: #155724;
-            margin: 15px 0;
-        }}
-        .footer {{
-            text-align: center;
-            margin-top: 30px;
-            padding-top: 20px;
-            border-top: 1px solid #e2e8f0;
-            color: #666;
-            font-size: 12px;
-        }}
-    </style>
-    {quiz_config}
-    {image_constants}
-</head>
-<body>
-    <div class="quiz-container">
-        <h1>{title}</h1>
-        <p class="quiz-description">{description}</p>
-        <div class="quiz-meta">
-            {author_line}
-            {company_line}
-        </div>
-        
-        <div class="timer-display" id="timerDisplay">
-            Time Remaining: <span id="timerValue">00:00</span>
-        </div>
-        
-        <div class="quiz-progress">
-            <div class="quiz-progress-bar" id="progressBar">0%</div>
-        </div>
-
-        <div id="quizContent"></div>
-
-        <div style="text-align: center; margin-top: 30px;">
-            <button class="quiz-button" id="prevBtn" onclick="prevQuestion()" style="display:none;">← Previous</button>
-            <button class="quiz-button" id="nextBtn" onclick="nextQuestion()" style="display:none;">Next →</button>
-            <button class="quiz-button" id="startBtn" onclick="startQuiz()">Start Quiz</button>
-            <button class="quiz-button" id="submitBtn" onclick="submitQuiz()" style="display:none;">Submit Quiz</button>
-            <button class="quiz-button" id="restartBtn" onclick="restartQuiz()" style="display:none;">Restart Quiz</button>
-        </div>
-
-        <div class="quiz-results" id="quizResults">
-            <h2 style="text-align: center; color: #2C5282;">Quiz Results</h2>
-            <div class="quiz-score" id="quizScore"></div>
-            <div id="resultDetails"></div>
-        </div>
-        
-        <div class="certificate" id="certificate">
-            <h2>🏆 Certificate of Completion 🏆</h2>
-            <p>This certifies that</p>
-            <div class="certificate-name" id="certificateName">[Name]</div>
-            <p>has successfully completed</p>
-            <div style="font-size: 20px; margin: 15px 0;"><strong>{title}</strong></div>
-            <div class="certificate-score" id="certificateScore"></div>
-            <div style="margin-top: 30px; color: #666;">
-                <p>{company}</p>
-                <p id="certificateDate"></p>
-            </div>
-        </div>
-        
-        <div class="footer">
-            {footer_text}
-        </div>
-    </div>
-
-    <script>
-        let quizQuestions = {questions_json};
-        let currentQuestion = 0;
-        let userAnswers = [];
-        let quizStarted = false;
-        
-        // Apply randomization if configured
-        if (QUIZ_CONFIG.randomizeQuestions) {{
-            quizQuestions = quizQuestions.sort(() => Math.random() - 0.5);
-        }}
-        
-        function startTimer() {{
-            if (QUIZ_CONFIG.timerMinutes > 0) {{
-                document.getElementById('timerDisplay').style.display = 'block';
-                updateTimerDisplay();
-                
-                timerInterval = setInterval(() => {{
-                    timeRemaining--;
-                    updateTimerDisplay();
-                    
-                    if (timeRemaining <= 0) {{
-                        clearInterval(timerInterval);
-                        alert('Time is up! Submitting quiz...');
-                        submitQuiz();
-                    }}
-                }}, 1000);
-            }}
-        }}
-        
-        function updateTimerDisplay() {{
-            const minutes = Math.floor(timeRemaining / 60);
-            const seconds = timeRemaining % 60;
-            const display = `${{String(minutes).padStart(2, '0')}}:${{String(seconds).padStart(2, '0')}}`;
-            document.getElementById('timerValue').textContent = display;
-            
-            const timerDiv = document.getElementById('timerDisplay');
-            if (timeRemaining < 60) {{
-                timerDiv.classList.add('danger');
-            }} else if (timeRemaining < 300) {{
-                timerDiv.classList.add('warning');
-            }}
-        }}
-
-        function startQuiz() {{
-            quizStarted = true;
-            currentQuestion = 0;
-            userAnswers = new Array(quizQuestions.length).fill(null);
-            document.getElementById('startBtn').style.display = 'none';
-            document.getElementById('nextBtn').style.display = 'inline-block';
-            document.getElementById('quizResults').style.display = 'none';
-            document.getElementById('certificateWrapper').style.display = 'none';
-            startTimer();
-            showQuestion();
-        }}
-
-        function showQuestion() {{
-            const question = quizQuestions[currentQuestion];
-            const quizContent = document.getElementById('quizContent');
-            
-            let difficultyBadge = '';
-            if (question.difficulty) {{
-                const diffClass = `difficulty-${{question.difficulty.toLowerCase()}}`;
-                difficultyBadge = `<span class="difficulty-badge ${{diffClass}}">${{question.difficulty}}</span>`;
-            }}
-            
-            let html = `
-                <div class="quiz-question">
-                    <h4>Question ${{currentQuestion + 1}} of ${{quizQuestions.length}} ${{difficultyBadge}}</h4>
-                    <p style="font-size: 18px; margin: 20px 0;">${{question.question}}</p>
-            `;
-            
-            // Add image if present
-            if (question.image) {{
-                const imagePath = typeof getImagePath === 'function' ? getImagePath(question.image) : question.image;
-                html += `<img src="${{imagePath}}" alt="Question ${{currentQuestion + 1}} Image" class="question-image" onerror="this.src='${{typeof PLACEHOLDER_IMAGE !== 'undefined' ? PLACEHOLDER_IMAGE : ''}}'">`;
-            }}
-            
-            html += '<div class="quiz-options">';
-            
-            question.options.forEach((option, index) => {{
-                const isSelected = userAnswers[currentQuestion] === index;
-                html += `
-                    <label class="quiz-option ${{isSelected ? 'selected' : ''}}" onclick="selectAnswer(${{index}})">
-                        <input type="radio" name="q${{currentQuestion}}" value="${{index}}" 
-                            ${{isSelected ? 'checked' : ''}} style="margin-right: 10px;">
-                        ${{String.fromCharCode(65 + index)}}) ${{option}}
-                    </label>
-                `;
-            }});
-            
-            html += '</div></div>';
-            quizContent.innerHTML = html;
-            
-            // Update navigation buttons
-            if (QUIZ_CONFIG.allowReview) {{
-                document.getElementById('prevBtn').style.display = currentQuestion > 0 ? 'inline-block' : 'none';
-            }}
-            document.getElementById('nextBtn').style.display = currentQuestion < quizQuestions.length - 1 ? 'inline-block' : 'none';
-            document.getElementById('submitBtn').style.display = currentQuestion === quizQuestions.length - 1 ? 'inline-block' : 'none';
-            
-            updateProgress();
-        }}
-
-        function selectAnswer(index) {{
-            userAnswers[currentQuestion] = index;
-            const options = document.querySelectorAll('.quiz-option');
-            options.forEach((option, i) => {{
-                option.classList.toggle('selected', i === index);
-            }});
-        }}
-
-        function nextQuestion() {{
-            if (currentQuestion < quizQuestions.length - 1) {{
-                currentQuestion++;
-                showQuestion();
-            }}
-        }}
-
-        function prevQuestion() {{
-            if (currentQuestion > 0) {{
-                currentQuestion--;
-                showQuestion();
-            }}
-        }}
-
-        function updateProgress() {{
-            const progress = ((currentQuestion + 1) / quizQuestions.length) * 100;
-            const progressBar = document.getElementById('progressBar');
-            progressBar.style.width = progress + '%';
-            progressBar.textContent = Math.round(progress) + '%';
-        }}
-
-        function submitQuiz() {{
-            if (timerInterval) {{
-                clearInterval(timerInterval);
-            }}
-            
-            if (!QUIZ_CONFIG.showResults) {{
-                alert('Quiz submitted successfully!');
-                location.reload();
-                return;
-            }}
-            
-            let correct = 0;
-            let resultHTML = '<div style="margin-top: 20px;">';
-            
-            quizQuestions.forEach((question, index) => {{
-                const userAnswer = userAnswers[index];
-                const isCorrect = userAnswer === question.correct;
-                if (isCorrect) correct++;
-                
-                resultHTML += `
-                    <div class="result-item ${{isCorrect ? 'correct' : 'incorrect'}}">
-                        <strong>Q${{index + 1}}: ${{isCorrect ? '✓ Correct' : '✗ Incorrect'}}</strong><br>
-                        <p style="margin: 10px 0;">${{question.question}}</p>
-                        <p style="color: #666;">Your answer: ${{userAnswer !== null ? question.options[userAnswer] : 'Not answered'}}</p>
-                        ${{!isCorrect ? `<p style="color: #155724;">Correct answer: ${{question.options[question.correct]}}</p>` : ''}}
-                        ${{QUIZ_CONFIG.showExplanations && question.explanation ? `<p style="font-style: italic; margin-top: 10px;">${{question.explanation}}</p>` : ''}}
-                    </div>
-                `;
-            }});
-            
-            resultHTML += '</div>';
-            
-            const percentage = Math.round((correct / quizQuestions.length) * 100);
-            const passed = percentage >= QUIZ_CONFIG.passThreshold;
-            
-            let feedback = '';
-            let color = '';
-            
-            if (percentage >= 90) {{
-                feedback = '🎉 Outstanding!';
-                color = '#28a745';
-            }} else if (percentage >= 80) {{
-                feedback = '🎉 Excellent work!';
-                color = '#28a745';
-            }} else if (percentage >= QUIZ_CONFIG.passThreshold) {{
-                feedback = '👍 Good job! You passed!';
-                color = '#ffc107';
-            }} else {{
-                feedback = '📚 Keep studying and try again!';
-                color = '#dc3545';
-            }}
-            
-            document.getElementById('quizScore').innerHTML = `
-                <div style="font-size: 48px; margin: 20px 0;">${{percentage}}%</div>
-                <div>You scored ${{correct}} out of ${{quizQuestions.length}}</div>
-                <div style="font-size: 20px; color: ${{color}}; margin-top: 15px;">${{feedback}}</div>
-                <div style="margin-top: 10px; font-size: 16px;">
-                    Pass Threshold: ${{QUIZ_CONFIG.passThreshold}}% - 
-                    <strong>${{passed ? 'PASSED ✓' : 'NOT PASSED ✗'}}</strong>
-                </div>
-            `;
-            document.getElementById('resultDetails').innerHTML = resultHTML;
-            
-            // Show certificate if enabled and passed
-            if (QUIZ_CONFIG.enableCertificate && passed) {{
-                const userName = prompt('Congratulations! Enter your name for the certificate:') || 'Participant';
-    
-                // Generate certificate ID here
-                const timestamp = Date.now().toString();
-                const random = Math.random().toString(36).substr(2, 4).toUpperCase();
-                const certData = userName + QUIZ_CONFIG.quizTitle + percentage + timestamp + random;
-                const certId = btoa(certData).replace(/[^A-Z0-9]/gi, '').substr(0, 12).toUpperCase();
-    
-                // Pass certId to the function
-                const certHTML = generateProfessionalCertificate(userName, percentage, certId);
-    
-                const iframe = document.getElementById('certificateFrame');
-                iframe.srcdoc = certHTML;
-                document.getElementById('certificateWrapper').style.display = 'block';
-            }}
-            
-            document.getElementById('quizContent').style.display = 'none';
-            document.getElementById('quizResults').style.display = 'block';
-            document.getElementById('submitBtn').style.display = 'none';
-            document.getElementById('nextBtn').style.display = 'none';
-            document.getElementById('prevBtn').style.display = 'none';
-            document.getElementById('restartBtn').style.display = 'inline-block';
-            document.getElementById('timerDisplay').style.display = 'none';
-            
-            document.getElementById('progressBar').style.width = '100%';
-            document.getElementById('progressBar').textContent = '100%';
-        }} 
-
-        function restartQuiz() {{
-            currentQuestion = 0;
-            userAnswers = [];
-            timeRemaining = QUIZ_CONFIG.timerMinutes * 60;
-            document.getElementById('quizContent').style.display = 'block';
-            document.getElementById('quizResults').style.display = 'none';
-            document.getElementById('certificateWrapper').style.display = 'none';
-            document.getElementById('restartBtn').style.display = 'none';
-            startQuiz();
-        }}
-    </script>
-</body>
-</html>'''
-            
-            # Format author and company lines
-            author_line = f"Created by: {author}" if author else ""
-            company_line = f"Organization: {company}" if company else ""
-            footer_text = f"©2025 {company}. All rights reserved | Generated with Quiz Generator - Multiaxis Intelligence"
-            
-            formatted_html = html_template.format(
-                title=self.quiz_title,
-                description=self.quiz_description,
-                author=author,
-                company=company,
-                author_line=author_line,
-                company_line=company_line,
-                footer_text=footer_text,
-                questions_json=json.dumps(self.questions),
-                quiz_config=quiz_config,
-                image_constants=image_constants if has_images else ""
-            )
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(formatted_html)
-            
-            msg = f"Generated clean HTML quiz with {len(self.questions)} questions"
-            if has_images:
-                msg += "\n⚠️ See answer key file for image setup instructions"
-            
-            return True, msg
-        except Exception as e:
-            return False, f"Error generating HTML: {str(e)}"
-        """Generate HTML quiz file with image support and company branding."""
-        if not self.questions:
-            return False, "No questions to generate"
-        
-        try:
-            # Check if any questions have images
-            has_images = any(q.get('image', '') for q in self.questions)
-            
-            # Get settings from parent app if available
-            author = getattr(self, 'author', '')
-            company = getattr(self, 'company', 'Multiaxis Intelligence')
-            show_results = getattr(self, 'show_results', True)
-            show_explanations = getattr(self, 'show_explanations', True)
-            allow_review = getattr(self, 'allow_review', True)
-            randomize = getattr(self, 'randomize', False)
-            
-            # Generate image constants section if needed
-            image_constants = ""
-            if has_images:
-                image_constants = """
-    <!-- ============================================= -->
-    <!-- IMAGE CONFIGURATION SECTION                   -->
-    <!-- Edit these paths to match your image files    -->
-    <!-- Images should be 1024x1024 for best display   -->
-    <!-- Place images in same folder as HTML file      -->
-    <!-- ============================================= -->
-    <script>
-        const IMAGE_PATHS = {
-            // Default image paths - edit these to match your files
-            // Format: "filename": "path/to/image.png"
-            """
-                
-                # Collect unique image filenames
-                image_files = set()
-                for i, q in enumerate(self.questions, 1):
-                    if q.get('image'):
-                        image_files.add(q['image'])
-                    elif q.get('image') == "auto":
-                        image_files.add(f"q{i}.png")
-                
-                # Add image path entries
-                for img in sorted(image_files):
-                    image_constants += f'\n            "{img}": "{img}",  // Question image'
-                
-                image_constants = image_constants.rstrip(',')
-                image_constants += """
-            
-            // Placeholder image (displays when image not found)
-            "placeholder": "data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='1024' height='1024' viewBox='0 0 1024 1024'%3E%3Crect width='1024' height='1024' fill='%23f0f0f0'/%3E%3Ctext x='512' y='512' font-family='Arial' font-size='48' fill='%23999' text-anchor='middle' dominant-baseline='middle'%3EImage Placeholder%3C/text%3E%3Ctext x='512' y='570' font-family='Arial' font-size='24' fill='%23999' text-anchor='middle'%3E1024 x 1024%3C/text%3E%3C/svg%3E"
-        };
-        
-        // Function to get image path with fallback
-        function getImagePath(filename) {
-            return IMAGE_PATHS[filename] || IMAGE_PATHS["placeholder"];
-        }
-    </script>
-"""
-            
-            # Quiz configuration script
-            quiz_config = f"""
-    <script>
-        // Quiz Configuration
-        const QUIZ_CONFIG = {{
-            showResults: {str(show_results).lower()},
-            showExplanations: {str(show_explanations).lower()},
-            allowReview: {str(allow_review).lower()},
-            randomizeQuestions: {str(randomize).lower()},
-            author: "{author}",
-            company: "{company}",
-            quizTitle: "{self.quiz_title}", 
-            copyright: "©2025 {company}. All rights reserved"
-        }};
-    </script>
-"""
-            
-            html_template = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="author" content="{author}">
-    <meta name="company" content="{company}">
-    <meta name="generator" content="Quiz Generator - Multiaxis Intelligence">
-    <title>{title}</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-            background: linear-gradient(135deg, #5B9BD5 0%, #2C5282 100%);
-            min-height: 100vh;
-        }}
-        .quiz-container {{
-            background: white;
-            padding: 30px;
-            border-radius: 15px;
-            margin: 20px auto;
-            max-width: 900px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-        }}
-        h1 {{
-            color: #2C5282;
-            text-align: center;
-            margin-bottom: 10px;
-        }}
-        .quiz-description {{
-            text-align: center;
-            color: #666;
-            margin-bottom: 10px;
-        }}
-        .quiz-meta {{
-            text-align: center;
-            color: #999;
-            font-size: 14px;
-            margin-bottom: 20px;
-        }}
-        .quiz-question {{
-            margin: 20px 0;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 10px;
-            border-left: 4px solid #5B9BD5;
-        }}
-        .quiz-question h4 {{
-            color: #2C5282;
-            margin-bottom: 15px;
-        }}
-        .question-image {{
-            width: 100%;
-            max-width: 600px;
-            height: auto;
-            margin: 20px auto;
-            display: block;
-            border-radius: 8px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .quiz-options {{
-            margin: 15px 0;
-        }}
-        .quiz-option {{
-            display: block;
-            margin: 10px 0;
-            padding: 15px;
-            background: white;
-            border: 2px solid #e2e8f0;
-            border-radius: 8px;
-            cursor: pointer;
-            transition: all 0.3s;
-        }}
-        .quiz-option:hover {{
-            background: #f0f4ff;
-            border-color: #5B9BD5;
-            transform: translateX(5px);
-        }}
-        .quiz-option.selected {{
-            background: #f0f4ff;
-            border-color: #5B9BD5;
-            font-weight: 600;
-        }}
-        .quiz-button {{
-            background: linear-gradient(135deg, #5B9BD5 0%, #2C5282 100%);
-            color: white;
-            padding: 12px 30px;
-            border: none;
-            border-radius: 25px;
-            font-size: 16px;
-            font-weight: 600;
-            cursor: pointer;
-            margin: 10px 5px;
-            transition: transform 0.2s;
-        }}
-        .quiz-button:hover {{
-            transform: scale(1.05);
-        }}
-        .quiz-button:disabled {{
-            background: #ccc;
-            cursor: not-allowed;
-            transform: scale(1);
-        }}
-        .quiz-results {{
-            padding: 30px;
-            background: linear-gradient(135deg, #f0f4ff 0%, #e8ecff 100%);
-            border-radius: 15px;
-            margin: 20px 0;
-            display: none;
-        }}
-        .quiz-score {{
-            font-size: 28px;
-            color: #2C5282;
-            font-weight: bold;
-            text-align: center;
-            margin: 20px 0;
-        }}
-        .quiz-progress {{
-            background: #e2e8f0;
-            height: 30px;
-            border-radius: 15px;
-            overflow: hidden;
-            margin: 20px 0;
-        }}
-        .quiz-progress-bar {{
-            background: linear-gradient(90deg, #5B9BD5 0%, #2C5282 100%);
-            height: 100%;
-            width: 0%;
-            transition: width 0.5s;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: bold;
-        }}
-        .result-item {{
-            margin: 15px 0;
-            padding: 15px;
-            border-radius: 8px;
-        }}
-        .result-item.correct {{
-            background: #d4edda;
-            border-left: 4px solid #28a745;
-        }}
-        .result-item.incorrect {{
-            background: #f8d7da;
-            border-left: 4px solid #dc3545;
-        }}
-        .image-note {{
-            background: #fff3cd;
-            border: 1px solid #ffc107;
-            padding: 10px;
-            margin: 20px 0;
-            border-radius: 5px;
-            font-size: 14px;
-            color: #856404;
-        }}
-        .footer {{
-            text-align: center;
-            margin-top: 30px;
-            padding-top: 20px;
-            border-top: 1px solid #e2e8f0;
-            color: #666;
-            font-size: 12px;
-        }}
-    </style>
-    {quiz_config}
-    {image_constants}
-</head>
-<body>
-    <div class="quiz-container">
-        <h1>{title}</h1>
-        <p class="quiz-description">{description}</p>
-        <div class="quiz-meta">
-            {author_line}
-            {company_line}
-        </div>
-        {image_section}
-        
-        <div class="quiz-progress">
-            <div class="quiz-progress-bar" id="progressBar">0%</div>
-        </div>
-
-        <div id="quizContent"></div>
-
-        <div style="text-align: center; margin-top: 30px;">
-            <button class="quiz-button" id="prevBtn" onclick="prevQuestion()" style="display:none;">← Previous</button>
-            <button class="quiz-button" id="nextBtn" onclick="nextQuestion()" style="display:none;">Next →</button>
-            <button class="quiz-button" id="startBtn" onclick="startQuiz()">Start Quiz</button>
-            <button class="quiz-button" id="submitBtn" onclick="submitQuiz()" style="display:none;">Submit Quiz</button>
-            <button class="quiz-button" id="restartBtn" onclick="restartQuiz()" style="display:none;">Restart Quiz</button>
-        </div>
-
-        <div class="quiz-results" id="quizResults">
-            <h2 style="text-align: center; color: #2C5282;">Quiz Results</h2>
-            <div class="quiz-score" id="quizScore"></div>
-            <div id="resultDetails"></div>
-        </div>
-        
-        <div class="footer">
-            {footer_text}
-        </div>
-    </div>
-
-    <script>
-        let quizQuestions = {questions_json};
-        let currentQuestion = 0;
-        let userAnswers = [];
-        let quizStarted = false;
-        
-        // Apply randomization if configured
-        if (QUIZ_CONFIG.randomizeQuestions) {{
-            quizQuestions = quizQuestions.sort(() => Math.random() - 0.5);
-        }}
-
-        function startQuiz() {{
-            quizStarted = true;
-            currentQuestion = 0;
-            userAnswers = new Array(quizQuestions.length).fill(null);
-            document.getElementById('startBtn').style.display = 'none';
-            document.getElementById('nextBtn').style.display = 'inline-block';
-            document.getElementById('quizResults').style.display = 'none';
-            showQuestion();
-        }}
-
-        function showQuestion() {{
-            const question = quizQuestions[currentQuestion];
-            const quizContent = document.getElementById('quizContent');
-            
-            let html = `
-                <div class="quiz-question">
-                    <h4>Question ${{currentQuestion + 1}} of ${{quizQuestions.length}}</h4>
-                    <p style="font-size: 18px; margin: 20px 0;">${{question.question}}</p>
-            `;
-            
-            // Add image if present
-            if (question.image) {{
-                const imagePath = typeof getImagePath === 'function' ? getImagePath(question.image) : question.image;
-                html += `<img src="${{imagePath}}" alt="Question ${{currentQuestion + 1}} Image" class="question-image" onerror="this.src='${{typeof getImagePath === 'function' ? getImagePath('placeholder') : ''}}'">`;
-            }}
-            
-            html += '<div class="quiz-options">';
-            
-            question.options.forEach((option, index) => {{
-                const isSelected = userAnswers[currentQuestion] === index;
-                html += `
-                    <label class="quiz-option ${{isSelected ? 'selected' : ''}}" onclick="selectAnswer(${{index}})">
-                        <input type="radio" name="q${{currentQuestion}}" value="${{index}}" 
-                            ${{isSelected ? 'checked' : ''}} style="margin-right: 10px;">
-                        ${{String.fromCharCode(65 + index)}}) ${{option}}
-                    </label>
-                `;
-            }});
-            
-            html += '</div></div>';
-            quizContent.innerHTML = html;
-            
-            // Update navigation buttons
-            if (QUIZ_CONFIG.allowReview) {{
-                document.getElementById('prevBtn').style.display = currentQuestion > 0 ? 'inline-block' : 'none';
-            }}
-            document.getElementById('nextBtn').style.display = currentQuestion < quizQuestions.length - 1 ? 'inline-block' : 'none';
-            document.getElementById('submitBtn').style.display = currentQuestion === quizQuestions.length - 1 ? 'inline-block' : 'none';
-            
-            updateProgress();
-        }}
-
-        function selectAnswer(index) {{
-            userAnswers[currentQuestion] = index;
-            const options = document.querySelectorAll('.quiz-option');
-            options.forEach((option, i) => {{
-                option.classList.toggle('selected', i === index);
-            }});
-        }}
-
-        function nextQuestion() {{
-            if (currentQuestion < quizQuestions.length - 1) {{
-                currentQuestion++;
-                showQuestion();
-            }}
-        }}
-
-        function prevQuestion() {{
-            if (currentQuestion > 0) {{
-                currentQuestion--;
-                showQuestion();
-            }}
-        }}
-
-        function updateProgress() {{
-            const progress = ((currentQuestion + 1) / quizQuestions.length) * 100;
-            const progressBar = document.getElementById('progressBar');
-            progressBar.style.width = progress + '%';
-            progressBar.textContent = Math.round(progress) + '%';
-        }}
-
-        function submitQuiz() {{
-            if (!QUIZ_CONFIG.showResults) {{
-                alert('Quiz submitted successfully!');
-                location.reload();
-                return;
-            }}
-            
-            let correct = 0;
-            let resultHTML = '<div style="margin-top: 20px;">';
-            
-            quizQuestions.forEach((question, index) => {{
-                const userAnswer = userAnswers[index];
-                const isCorrect = userAnswer === question.correct;
-                if (isCorrect) correct++;
-                
-                resultHTML += `
-                    <div class="result-item ${{isCorrect ? 'correct' : 'incorrect'}}">
-                        <strong>Q${{index + 1}}: ${{isCorrect ? '✓ Correct' : '✗ Incorrect'}}</strong><br>
-                        <p style="margin: 10px 0;">${{question.question}}</p>
-                        <p style="color: #666;">Your answer: ${{userAnswer !== null ? question.options[userAnswer] : 'Not answered'}}</p>
-                        ${{!isCorrect ? `<p style="color: #155724;">Correct answer: ${{question.options[question.correct]}}</p>` : ''}}
-                        ${{QUIZ_CONFIG.showExplanations && question.explanation ? `<p style="font-style: italic; margin-top: 10px;">${{question.explanation}}</p>` : ''}}
-                    </div>
-                `;
-            }});
-            
-            resultHTML += '</div>';
-            
-            const percentage = Math.round((correct / quizQuestions.length) * 100);
-            let feedback = '';
-            let color = '';
-            
-            if (percentage >= 80) {{
-                feedback = '🎉 Excellent work!';
-                color = '#28a745';
-            }} else if (percentage >= 60) {{
-                feedback = '👍 Good effort! Review the missed topics.';
-                color = '#ffc107';
-            }} else {{
-                feedback = '📚 Keep studying and try again!';
-                color = '#dc3545';
-            }}
-            
-            document.getElementById('quizScore').innerHTML = `
-                <div style="font-size: 48px; margin: 20px 0;">${{percentage}}%</div>
-                <div>You scored ${{correct}} out of ${{quizQuestions.length}}</div>
-                <div style="font-size: 20px; color: ${{color}}; margin-top: 15px;">${{feedback}}</div>
-            `;
-            document.getElementById('resultDetails').innerHTML = resultHTML;
-            
-            document.getElementById('quizContent').style.display = 'none';
-            document.getElementById('quizResults').style.display = 'block';
-            document.getElementById('submitBtn').style.display = 'none';
-            document.getElementById('nextBtn').style.display = 'none';
-            document.getElementById('prevBtn').style.display = 'none';
-            document.getElementById('restartBtn').style.display = 'inline-block';
-            
-            document.getElementById('progressBar').style.width = '100%';
-            document.getElementById('progressBar').textContent = '100%';
-        }}
-
-        function restartQuiz() {{
-            currentQuestion = 0;
-            userAnswers = [];
-            document.getElementById('quizContent').style.display = 'block';
-            document.getElementById('quizResults').style.display = 'none';
-            document.getElementById('restartBtn').style.display = 'none';
-            startQuiz();
-        }}
-    </script>
-</body>
-</html>'''
-            
-            # Add image note if images are present
-            image_note = ""
-            if has_images:
-                image_note = f'''<div class="image-note">
-            <strong>📌 Image Setup Instructions:</strong><br>
-            1. Place your images (1024x1024 recommended) in the same folder as this HTML file<br>
-            2. Edit the IMAGE_PATHS section in the HTML source to match your filenames<br>
-            3. Images expected: {', '.join(sorted(image_files))}<br>
-            4. Images will display inline with questions
-        </div>'''
-            
-            # Format author and company lines
-            author_line = f"Created by: {author}" if author else ""
-            company_line = f"Organization: {company}" if company else ""
-            footer_text = f"©2025 {company}. All rights reserved | Generated with Quiz Generator - Multiaxis Intelligence"
-            
-            formatted_html = html_template.format(
-                title=self.quiz_title,
-                description=self.quiz_description,
-                author=author,
-                company=company,
-                author_line=author_line,
-                company_line=company_line,
-                footer_text=footer_text,
-                questions_json=json.dumps(self.questions),
-                quiz_config=quiz_config,
-                image_section=image_note,
-                image_constants=image_constants if has_images else ""
-            )
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(formatted_html)
-            
-            return True, f"Generated HTML quiz with {len(self.questions)} questions" + (f" ({len(image_files)} with images)" if has_images else "")
-        except Exception as e:
-            return False, f"Error generating HTML: {str(e)}"
-        """Generate HTML quiz file with image support."""
-        if not self.questions:
-            return False, "No questions to generate"
-        
-        try:
-            # Check if any questions have images
-            has_images = any(q.get('image', '') for q in self.questions)
-            
-            # Generate image constants section if needed
-            image_constants = ""
-            if has_images:
-                image_constants = """
-    <!-- ============================================= -->
-    <!-- IMAGE CONFIGURATION SECTION                   -->
-    <!-- Edit these paths to match your image files    -->
-    <!-- Images should be 1024x1024 for best display   -->
-    <!-- Place images in same folder as HTML file      -->
-    <!-- ============================================= -->
-    <script>
-        const IMAGE_PATHS = {
-            // Default image paths - edit these to match your files
-            // Format: "filename": "path/to/image.png"
-            """
-                
-                # Collect unique image filenames
-                image_files = set()
-                for i, q in enumerate(self.questions, 1):
-                    if q.get('image'):
-                        image_files.add(q['image'])
-                    elif q.get('image') == "auto":
-                        image_files.add(f"q{i}.png")
-                
-                # Add image path entries
-                for img in sorted(image_files):
-                    image_constants += f'\n            "{img}": "{img}",  // Question image'
-                
-                image_constants = image_constants.rstrip(',')
-                image_constants += """
-            
-            // Placeholder image (displays when image not found)
-            "placeholder": "data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='1024' height='1024' viewBox='0 0 1024 1024'%3E%3Crect width='1024' height='1024' fill='%23f0f0f0'/%3E%3Ctext x='512' y='512' font-family='Arial' font-size='48' fill='%23999' text-anchor='middle' dominant-baseline='middle'%3EImage Placeholder%3C/text%3E%3Ctext x='512' y='570' font-family='Arial' font-size='24' fill='%23999' text-anchor='middle'%3E1024 x 1024%3C/text%3E%3C/svg%3E"
-        };
-        
-        // Function to get image path with fallback
-        function getImagePath(filename) {
-            return IMAGE_PATHS[filename] || IMAGE_PATHS["placeholder"];
-        }
-    </script>
-"""
-            
-            html_template = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-            background: linear-gradient(135deg, #5B9BD5 0%, #2C5282 100%);
-            min-height: 100vh;
-        }}
-        .quiz-container {{
-            background: white;
-            padding: 30px;
-            border-radius: 15px;
-            margin: 20px auto;
-            max-width: 900px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-        }}
-        h1 {{
-            color: #2C5282;
-            text-align: center;
-            margin-bottom: 10px;
-        }}
-        .quiz-description {{
-            text-align: center;
-            color: #666;
-            margin-bottom: 30px;
-        }}
-        .quiz-question {{
-            margin: 20px 0;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 10px;
-            border-left: 4px solid #5B9BD5;
-        }}
-        .quiz-question h4 {{
-            color: #2C5282;
-            margin-bottom: 15px;
-        }}
-        .question-image {{
-            width: 100%;
-            max-width: 600px;
-            height: auto;
-            margin: 20px auto;
-            display: block;
-            border-radius: 8px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .quiz-options {{
-            margin: 15px 0;
-        }}
-        .quiz-option {{
-            display: block;
-            margin: 10px 0;
-            padding: 15px;
-            background: white;
-            border: 2px solid #e2e8f0;
-            border-radius: 8px;
-            cursor: pointer;
-            transition: all 0.3s;
-        }}
-        .quiz-option:hover {{
-            background: #f0f4ff;
-            border-color: #5B9BD5;
-            transform: translateX(5px);
-        }}
-        .quiz-option.selected {{
-            background: #f0f4ff;
-            border-color: #5B9BD5;
-            font-weight: 600;
-        }}
-        .quiz-button {{
-            background: linear-gradient(135deg, #5B9BD5 0%, #2C5282 100%);
-            color: white;
-            padding: 12px 30px;
-            border: none;
-            border-radius: 25px;
-            font-size: 16px;
-            font-weight: 600;
-            cursor: pointer;
-            margin: 10px 5px;
-            transition: transform 0.2s;
-        }}
-        .quiz-button:hover {{
-            transform: scale(1.05);
-        }}
-        .quiz-button:disabled {{
-            background: #ccc;
-            cursor: not-allowed;
-            transform: scale(1);
-        }}
-        .quiz-results {{
-            padding: 30px;
-            background: linear-gradient(135deg, #f0f4ff 0%, #e8ecff 100%);
-            border-radius: 15px;
-            margin: 20px 0;
-            display: none;
-        }}
-        .quiz-score {{
-            font-size: 28px;
-            color: #2C5282;
-            font-weight: bold;
-            text-align: center;
-            margin: 20px 0;
-        }}
-        .quiz-progress {{
-            background: #e2e8f0;
-            height: 30px;
-            border-radius: 15px;
-            overflow: hidden;
-            margin: 20px 0;
-        }}
-        .quiz-progress-bar {{
-            background: linear-gradient(90deg, #5B9BD5 0%, #2C5282 100%);
-            height: 100%;
-            width: 0%;
-            transition: width 0.5s;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: bold;
-        }}
-        .result-item {{
-            margin: 15px 0;
-            padding: 15px;
-            border-radius: 8px;
-        }}
-        .result-item.correct {{
-            background: #d4edda;
-            border-left: 4px solid #28a745;
-        }}
-        .result-item.incorrect {{
-            background: #f8d7da;
-            border-left: 4px solid #dc3545;
-        }}
-        .image-note {{
-            background: #fff3cd;
-            border: 1px solid #ffc107;
-            padding: 10px;
-            margin: 20px 0;
-            border-radius: 5px;
-            font-size: 14px;
-            color: #856404;
-        }}
-    </style>
-</head>
-<body>
-    <div class="quiz-container">
-        <h1>{title}</h1>
-        <p class="quiz-description">{description}</p>
-        {image_section}
-        
-        <div class="quiz-progress">
-            <div class="quiz-progress-bar" id="progressBar">0%</div>
-        </div>
-
-        <div id="quizContent"></div>
-
-        <div style="text-align: center; margin-top: 30px;">
-            <button class="quiz-button" id="prevBtn" onclick="prevQuestion()" style="display:none;">← Previous</button>
-            <button class="quiz-button" id="nextBtn" onclick="nextQuestion()" style="display:none;">Next →</button>
-            <button class="quiz-button" id="startBtn" onclick="startQuiz()">Start Quiz</button>
-            <button class="quiz-button" id="submitBtn" onclick="submitQuiz()" style="display:none;">Submit Quiz</button>
-            <button class="quiz-button" id="restartBtn" onclick="restartQuiz()" style="display:none;">Restart Quiz</button>
-        </div>
-
-        <div class="quiz-results" id="quizResults">
-            <h2 style="text-align: center; color: #2C5282;">Quiz Results</h2>
-            <div class="quiz-score" id="quizScore"></div>
-            <div id="resultDetails"></div>
-        </div>
-    </div>
-
-    <script>
-        const quizQuestions = {questions_json};
-        let currentQuestion = 0;
-        let userAnswers = [];
-        let quizStarted = false;
-
-        function startQuiz() {{
-            quizStarted = true;
-            currentQuestion = 0;
-            userAnswers = new Array(quizQuestions.length).fill(null);
-            document.getElementById('startBtn').style.display = 'none';
-            document.getElementById('nextBtn').style.display = 'inline-block';
-            document.getElementById('quizResults').style.display = 'none';
-            showQuestion();
-        }}
-
-        function showQuestion() {{
-            const question = quizQuestions[currentQuestion];
-            const quizContent = document.getElementById('quizContent');
-            
-            let html = `
-                <div class="quiz-question">
-                    <h4>Question ${{currentQuestion + 1}} of ${{quizQuestions.length}}</h4>
-                    <p style="font-size: 18px; margin: 20px 0;">${{question.question}}</p>
-            `;
-            
-            // Add image if present
-            if (question.image) {{
-                const imagePath = typeof getImagePath === 'function' ? getImagePath(question.image) : question.image;
-                html += `<img src="${{imagePath}}" alt="Question ${{currentQuestion + 1}} Image" class="question-image" onerror="this.src='${{typeof getImagePath === 'function' ? getImagePath('placeholder') : ''}}'">`;
-            }}
-            
-            html += '<div class="quiz-options">';
-            
-            question.options.forEach((option, index) => {{
-                const isSelected = userAnswers[currentQuestion] === index;
-                html += `
-                    <label class="quiz-option ${{isSelected ? 'selected' : ''}}" onclick="selectAnswer(${{index}})">
-                        <input type="radio" name="q${{currentQuestion}}" value="${{index}}" 
-                            ${{isSelected ? 'checked' : ''}} style="margin-right: 10px;">
-                        ${{String.fromCharCode(65 + index)}}) ${{option}}
-                    </label>
-                `;
-            }});
-            
-            html += '</div></div>';
-            quizContent.innerHTML = html;
-            
-            document.getElementById('prevBtn').style.display = currentQuestion > 0 ? 'inline-block' : 'none';
-            document.getElementById('nextBtn').style.display = currentQuestion < quizQuestions.length - 1 ? 'inline-block' : 'none';
-            document.getElementById('submitBtn').style.display = currentQuestion === quizQuestions.length - 1 ? 'inline-block' : 'none';
-            
-            updateProgress();
-        }}
-
-        function selectAnswer(index) {{
-            userAnswers[currentQuestion] = index;
-            const options = document.querySelectorAll('.quiz-option');
-            options.forEach((option, i) => {{
-                option.classList.toggle('selected', i === index);
-            }});
-        }}
-
-        function nextQuestion() {{
-            if (currentQuestion < quizQuestions.length - 1) {{
-                currentQuestion++;
-                showQuestion();
-            }}
-        }}
-
-        function prevQuestion() {{
-            if (currentQuestion > 0) {{
-                currentQuestion--;
-                showQuestion();
-            }}
-        }}
-
-        function updateProgress() {{
-            const progress = ((currentQuestion + 1) / quizQuestions.length) * 100;
-            const progressBar = document.getElementById('progressBar');
-            progressBar.style.width = progress + '%';
-            progressBar.textContent = Math.round(progress) + '%';
-        }}
-
-        function submitQuiz() {{
-            let correct = 0;
-            let resultHTML = '<div style="margin-top: 20px;">';
-            
-            quizQuestions.forEach((question, index) => {{
-                const userAnswer = userAnswers[index];
-                const isCorrect = userAnswer === question.correct;
-                if (isCorrect) correct++;
-                
-                resultHTML += `
-                    <div class="result-item ${{isCorrect ? 'correct' : 'incorrect'}}">
-                        <strong>Q${{index + 1}}: ${{isCorrect ? '✓ Correct' : '✗ Incorrect'}}</strong><br>
-                        <p style="margin: 10px 0;">${{question.question}}</p>
-                        <p style="color: #666;">Your answer: ${{userAnswer !== null ? question.options[userAnswer] : 'Not answered'}}</p>
-                        ${{!isCorrect ? `<p style="color: #155724;">Correct answer: ${{question.options[question.correct]}}</p>` : ''}}
-                        ${{question.explanation ? `<p style="font-style: italic; margin-top: 10px;">${{question.explanation}}</p>` : ''}}
-                    </div>
-                `;
-            }});
-            
-            resultHTML += '</div>';
-            
-            const percentage = Math.round((correct / quizQuestions.length) * 100);
-            let feedback = '';
-            let color = '';
-            
-            if (percentage >= 80) {{
+                feedback = '🎉 Outstanding!';
+                color = '#28a745';
+            }} else if (percentage >= 80) {{
                 feedback = '🎉 Excellent work!';
                 color = '#28a745';
-            }} else if (percentage >= 60) {{
-                feedback = '👍 Good effort! Review the missed topics.';
+            }} else if (percentage >= QUIZ_CONFIG.passThreshold) {{
+                feedback = '👍 Good job! You passed!';
                 color = '#ffc107';
             }} else {{
                 feedback = '📚 Keep studying and try again!';
                 color = '#dc3545';
             }}
             
-            document.getElementById('quizScore').innerHTML = `
+            els.quizScore.innerHTML = `
                 <div style="font-size: 48px; margin: 20px 0;">${{percentage}}%</div>
                 <div>You scored ${{correct}} out of ${{quizQuestions.length}}</div>
                 <div style="font-size: 20px; color: ${{color}}; margin-top: 15px;">${{feedback}}</div>
+                <div style="margin-top: 10px; font-size: 16px;">
+                    Pass Threshold: ${{QUIZ_CONFIG.passThreshold}}% - 
+                    <strong>${{passed ? 'PASSED ✓' : 'NOT PASSED ✗'}}</strong>
+                </div>
             `;
-            document.getElementById('resultDetails').innerHTML = resultHTML;
+            els.resultDetails.replaceChildren(result.details);
+
+            // Show certificate if enabled and passed
+            if (QUIZ_CONFIG.enableCertificate && passed) {{
+                const userName = prompt('Congratulations! Enter your name for the certificate:') || 'Participant';
+    
+                // Generate certificate ID here (randomUUID is missing on older browsers and plain http)
+                const certId = (crypto.randomUUID
+                    ? crypto.randomUUID().replace(/-/g, '')
+                    : Math.random().toString(36).slice(2) + Math.random().toString(36).slice(2)
+                ).slice(0, 12).toUpperCase();
+    
+                // Pass certId to the function
+                const certHTML = generateProfessionalCertificate(userName, percentage, certId);
+    
+                const iframe = els.certificateFrame;
+                iframe.srcdoc = certHTML;
+                els.certificateWrapper.style.display = 'block';
+            }}
             
-            document.getElementById('quizContent').style.display = 'none';
-            document.getElementById('quizResults').style.display = 'block';
-            document.getElementById('submitBtn').style.display = 'none';
-            document.getElementById('nextBtn').style.display = 'none';
-            document.getElementById('prevBtn').style.display = 'none';
-            document.getElementById('restartBtn').style.display = 'inline-block';
+            els.quizContent.style.display = 'none';
+            els.quizResults.style.display = 'block';
+            els.timerDisplay.style.display = 'none';
             
-            document.getElementById('progressBar').style.width = '100%';
-            document.getElementById('progressBar').textContent = '100%';
+            // Queued behind any pending navigation writes so they cannot undo these
+            scheduleWrite(() => {{
+                setControlsPhase('phase-results');
+                els.progressBar.style.transform = 'scaleX(1)';
+                els.progressText.textContent = '100%';
+            }});
+        }} 
+{certificate_script}
+        function downloadCertificate() {{
+            const iframe = els.certificateFrame;
+            const iframeDoc = iframe.contentDocument || iframe.contentWindow.document;
+            // The saved file outlives this page's blob URL, so put the logo data back in
+            const certificateHTML = iframeDoc.documentElement.outerHTML.split(getLogoUrl()).join(LOGO_DATA);
+    
+            const blob = new Blob([certificateHTML], {{type: 'text/html;charset=utf-8'}});
+            const url = URL.createObjectURL(blob);
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = `certificate_${{Date.now()}}.html`;
+            document.body.appendChild(a);
+            a.click();
+            document.body.removeChild(a);
+            URL.revokeObjectURL(url);
         }}
 
+        function printCertificate() {{
+            const iframe = els.certificateFrame;
+            iframe.contentWindow.print();
+        }}
+            
         function restartQuiz() {{
             currentQuestion = 0;
             userAnswers = [];
-            document.getElementById('quizContent').style.display = 'block';
-            document.getElementById('quizResults').style.display = 'none';
-            document.getElementById('restartBtn').style.display = 'none';
+            timeRemaining = QUIZ_CONFIG.timerMinutes * 60;
+            els.quizContent.style.display = 'block';
+            els.quizResults.style.display = 'none';
+            els.certificateWrapper.style.display = 'none';
             startQuiz();
         }}
     </script>
 </body>
-</html>'''
+</html>"""
+
+def compact_template_parts(template):
+    """Split a format template into (UTF-8 literal, field name) pairs, minified once.
+
+    Literal runs split by escaped braces are merged, and their indentation and
+    blank lines are dropped. Field values are left untouched.
+    """
+    parts = []
+    pending = ''
+    for literal, field, _, _ in string.Formatter().parse(template):
+        pending += literal
+        if field is None:
+            continue
+        parts.append((pending, field))
+        pending = ''
+    parts.append((pending, None))
+    return tuple(
+        (re.sub(r'[ \t]*\n\s*', '\n', literal).encode('utf-8'), field)
+        for literal, field in parts
+    )
+
+
+# QUIZ_HTML_TEMPLATE pre-split and minified so each generation only streams the
+# pieces and encodes just the fields; parsing here also surfaces brace errors on import
+QUIZ_HTML_PARTS = compact_template_parts(QUIZ_HTML_TEMPLATE)
+
+
+def generate_quiz_html(output_file: str, questions: List[Dict[str, Any]], quiz_title: str,
+                       quiz_description: str, settings: Optional[Dict[str, Any]] = None):
+    """Write an HTML quiz from plain data; safe to run in a worker process."""
+    logging.info(f"Starting HTML generation for: {output_file}")
+    
+    if not questions:
+        logging.warning("No questions available for HTML generation")
+        return False, "No questions to generate"
+    
+    try:
+        # Log quiz details
+        logging.info(f"Quiz title: {quiz_title}")
+        logging.info(f"Number of questions: {len(questions)}")
+        
+        # Embed logo as base64 FIRST - before using it
+        logo_base64 = get_logo_base64()
+
+        # Collect unique image filenames in a single pass over the questions
+        # (a dict keeps first-use order, so no sort is needed for stable output)
+        image_files = {}
+        for i, q in enumerate(questions, 1):
+            image = q.get('image')
+            if image:
+                image_files[image] = None
+                logging.debug("Question %d has image: %s", i, image)
+        
+        has_images = bool(image_files)
+        logging.info(f"Has images: {has_images}")
+        
+        # Settings fall back to the defaults the app starts with
+        settings = settings or {}
+        author = settings.get('author', 'Arlo AI Assistant')
+        company = settings.get('company', 'Multiaxis Intelligence')
+        show_results = settings.get('show_results', True)
+        show_explanations = settings.get('show_explanations', True)
+        allow_review = settings.get('allow_review', True)
+        randomize = settings.get('randomize', False)
+        timer_minutes = settings.get('timer_minutes', 0)
+        pass_threshold = settings.get('pass_threshold', 70)
+        enable_certificate = settings.get('enable_certificate', False)
+        external_css = settings.get('external_css', False)
+        precompress = settings.get('precompress', False)
+        
+        logging.debug("Settings - Author: %s, Company: %s, Timer: %s", author, company, timer_minutes)
+        
+        # Generate image constants section if needed (but cleaner)
+        image_constants = ""
+        if has_images:
+            logging.info("Generating image constants section")
+            image_constants = build_image_constants(tuple(image_files))
+        
+        # Quiz configuration script
+        quiz_config = build_quiz_config(
+            bool(show_results), bool(show_explanations), bool(allow_review), bool(randomize),
+            timer_minutes, pass_threshold, bool(enable_certificate),
+            author, company, quiz_title
+        )
+        
+        # Stylesheet: inline, or a shared file that many quizzes in one folder can reuse
+        if external_css:
+            css_file = quiz_css_filename()
+            css_path = os.path.join(os.path.dirname(os.path.abspath(output_file)), css_file)
+            if not os.path.exists(css_path):
+                with open(css_path, 'w', encoding='utf-8') as f:
+                    f.write(QUIZ_CSS_MIN)
+                logging.info(f"Wrote shared stylesheet: {css_path}")
+            stylesheet = f'<link rel="stylesheet" href="{css_file}">'
+        else:
+            stylesheet = '<style>' + QUIZ_CSS_MIN + '    </style>'
+        
+        # Certificate code (and the embedded logo) is only shipped when it can be used
+        certificate_script = ""
+        if enable_certificate:
+            certificate_script = CERTIFICATE_SCRIPT_TEMPLATE.format(
+                cert_parts=script_json(certificate_parts(
+                    quiz_title=html.escape(quiz_title or 'Professional Assessment'),
+                    author=html.escape(author or 'Instructor'),
+                    company=html.escape(company)
+                )),
+                logo_json=script_json(logo_base64)
+            )
+        
+        # User text lands in markup (and meta attributes), so escape it once here;
+        # the JS config above gets the raw values as JSON
+        author_html = html.escape(author)
+        company_html = html.escape(company)
+        
+        # Format author and company lines
+        author_line = f"Created by: {author_html}" if author else ""
+        company_line = f"Organization: {company_html}" if company else ""
+        footer_text = f"©2025 {company_html}. All rights reserved | Generated with Quiz Generator - Multiaxis Intelligence"
+        
+        logging.info("Preparing HTML template values")
+        
+        fields = dict(
+            title=html.escape(quiz_title),
+            stylesheet=stylesheet,
+            description=html.escape(quiz_description),
+            author=author_html,
+            company=company_html,
+            author_line=author_line,
+            company_line=company_line,
+            footer_text=footer_text,
+            questions_json=iter_script_json(questions),
+            quiz_config=quiz_config,
+            image_constants=image_constants if has_images else "",
+            certificate_script=certificate_script
+        )
+        
+        logging.info(f"Writing HTML to file: {output_file}")
+        
+        # Stream the template and its fields straight to disk instead of
+        # building the whole page (which may hold a large question bank) first
+        with open(output_file, 'wb', buffering=HTML_WRITE_BUFFER) as f:
+            for literal, field in QUIZ_HTML_PARTS:
+                f.write(literal)
+                if field is not None:
+                    value = fields[field]
+                    # The questions arrive as JSON pieces; everything else is a string
+                    if isinstance(value, str):
+                        f.write(value.encode('utf-8'))
+                    else:
+                        f.writelines(chunk.encode('utf-8') for chunk in value)
+        
+        # Optional gzip sibling for static servers that serve precompressed files
+        if precompress:
+            with open(output_file, 'rb') as src, gzip.open(output_file + '.gz', 'wb', compresslevel=9) as dst:
+                shutil.copyfileobj(src, dst, HTML_WRITE_BUFFER)
+            logging.info(f"Wrote precompressed copy: {output_file}.gz")
+        
+        msg = f"Generated clean HTML quiz with {len(questions)} questions"
+        if external_css:
+            msg += f"\nKeep {css_file} in the same folder as the quiz"
+        if has_images:
+            msg += "\n⚠️ See answer key file for image setup instructions"
+        
+        logging.info(f"HTML generation successful: {msg}")
+        return True, msg
+        
+    except Exception as e:
+        error_msg = f"Error generating HTML: {str(e)}"
+        logging.error(error_msg)
+        logging.error(traceback.format_exc())
+        return False, error_msg
+
+
+def _generate_quiz_spec(spec):
+    """Process pool entry point for generate_many()."""
+    return generate_quiz_html(**spec)
+
+
+def generate_many(specs, max_workers: Optional[int] = None):
+    """Generate several quizzes in parallel, one process per CPU by default.
+
+    Each spec is a dict of generate_quiz_html() keyword arguments. Returns the
+    (success, message) result for every spec, in order.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_generate_quiz_spec, specs))
+
+
+class QuizGenerator:
+    def __init__(self, quiz_title: str = "Interactive Knowledge Quiz", 
+                 quiz_description: str = "Test your knowledge with this interactive quiz."):
+        self.quiz_title = quiz_title
+        self.quiz_description = quiz_description
+        self.questions = []
+
+
+    def add_question(self, question: str, options: List[str], correct_index: int, 
+                     explanation: str = "", image_filename: str = ""):
+        """Add a question to the quiz."""
+        self.questions.append({
+            "question": question,
+            "options": options,
+            "correct": correct_index,
+            "explanation": explanation,
+            "image": image_filename
+        })
+
+
+    def clear_questions(self):
+        """Clear all questions."""
+        self.questions = []
+
+
+    def get_question_count(self):
+        """Get number of questions."""
+        return len(self.questions)
+
+
+    def load_from_csv(self, csv_file: str):
+        """Load questions from CSV file."""
+        try:
+            # Read and decode the whole file once, then parse rows positionally
+            with open(csv_file, 'rb') as file:
+                text = file.read().decode('utf-8-sig')
             
-            # Add image note if images are present
-            image_note = ""
-            if has_images:
-                image_note = f'''<div class="image-note">
-            <strong>📌 Image Setup Instructions:</strong><br>
-            1. Place your images (1024x1024 recommended) in the same folder as this HTML file<br>
-            2. Edit the IMAGE_PATHS section in the HTML source to match your filenames<br>
-            3. Images expected: {', '.join(sorted(image_files))}<br>
-            4. Images will display inline with questions
-        </div>'''
+            reader = csv.reader(io.StringIO(text, newline=''))
             
-            formatted_html = html_template.format(
-                title=self.quiz_title,
-                description=self.quiz_description,
-                questions_json=json.dumps(self.questions),
-                image_section=image_constants + image_note if has_images else ""
-            )
+            # Normalize headers once: "Option A" -> "option_a", "Question" -> "question"
+            columns = {}
+            for index, name in enumerate(next(reader, [])):
+                columns.setdefault(name.strip().lower().replace(' ', '_'), index)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(formatted_html)
+            question_cols = [columns[name] for name in ('question',) if name in columns]
+            option_cols = [columns[name] for name in ('option_a', 'option_b', 'option_c', 'option_d') if name in columns]
+            correct_cols = [columns[name] for name in ('correct_answer', 'correct', 'answer') if name in columns]
+            explanation_cols = [columns[name] for name in ('explanation',) if name in columns]
+            
+            count = 0
+            for row in reader:
+                question = self._first_value(row, question_cols)
+                
+                options = [row[i] for i in option_cols if i < len(row)]
+                options = [opt for opt in options if opt and opt.strip()]
+                
+                correct_answer = self._first_value(row, correct_cols)
+                correct_index = self._parse_correct_answer(correct_answer, options)
+                
+                explanation = self._first_value(row, explanation_cols) or ""
+                
+                if question and options and correct_index is not None:
+                    self.add_question(question, options, correct_index, explanation)
+                    count += 1
+            
+            return True, f"Loaded {count} questions from CSV"
+        except Exception as e:
+            return False, f"Error loading CSV: {str(e)}"
+
+
+    @staticmethod
+    def _first_value(row: List[str], indices: List[int]) -> Optional[str]:
+        """Return the first non-empty cell of a CSV row among the given columns."""
+        for index in indices:
+            if index < len(row) and row[index]:
+                return row[index]
+        return None
+
+
+    def load_from_json(self, json_file: str):
+        """Load questions from JSON file."""
+        try:
+            if orjson:
+                with open(json_file, 'rb') as file:
+                    data = orjson.loads(file.read())
+            else:
+                with open(json_file, 'r', encoding='utf-8') as file:
+                    data = json.load(file)
+            
+            if 'title' in data:
+                self.quiz_title = data['title']
+            if 'description' in data:
+                self.quiz_description = data['description']
+            
+            questions = data.get('questions', data if isinstance(data, list) else [])
+            count = 0
+            for q in questions:
+                if all(key in q for key in ['question', 'options', 'correct']):
+                    self.add_question(
+                        question=q['question'],
+                        options=q['options'],
+                        correct_index=q['correct'],
+                        explanation=q.get('explanation', '')
+                    )
+                    count += 1
+            
+            return True, f"Loaded {count} questions from JSON"
+        except Exception as e:
+            return False, f"Error loading JSON: {str(e)}"
+
+
+    def load_from_text(self, text_content: str):
+        """Load questions from formatted text."""
+        try:
+            questions_found = 0
+            question_blocks = text_content.split('---')
+            
+            for block in question_blocks:
+                if not block.strip():
+                    continue
+                
+                lines = block.strip().splitlines()
+                question = ""
+                options = []
+                correct_answer = ""
+                explanation = ""
+                
+                for line in lines:
+                    line = line.strip()
+                    # Dispatch on the first character to skip prefix checks that cannot match
+                    first = line[:1]
+                    if first == 'Q' and line.startswith('Q:'):
+                        question = line[2:].strip()
+                    elif first in _OPTION_LETTERS and line[1:2] == ':':
+                        options.append(line[2:].strip())
+                    elif first == 'C' and line.startswith('Correct:'):
+                        correct_answer = line[8:].strip()
+                    elif first == 'E' and line.startswith('Explanation:'):
+                        explanation = line[12:].strip()
+                
+                if question and options:
+                    correct_index = self._parse_correct_answer(correct_answer, options)
+                    if correct_index is not None:
+                        self.add_question(question, options, correct_index, explanation)
+                        questions_found += 1
+            
+            return True, f"Loaded {questions_found} questions from text"
+        except Exception as e:
+            return False, f"Error parsing text: {str(e)}"
+
+
+    def _parse_correct_answer(self, correct_answer: str, options: List[str]) -> Optional[int]:
+        """Parse correct answer from various formats."""
+        if not correct_answer:
+            return None
+        
+        if not isinstance(correct_answer, str):
+            correct_answer = str(correct_answer)
+        correct_answer = correct_answer.strip().upper()
+        
+        index = _LETTER_TO_INDEX.get(correct_answer)
+        if index is not None:
+            return index
+        
+        try:
+            index = int(correct_answer) - 1
+            if 0 <= index < len(options):
+                return index
+        except ValueError:
+            pass
+        
+        return None
+
+
+    def save_to_csv(self, output_file: str):
+        """Save questions to CSV."""
+        try:
+            # Pad/trim options to the four CSV columns
+            rows = [
+                [q['question'], *(q['options'] + [''] * 4)[:4], chr(65 + q['correct']), q['explanation']]
+                for q in self.questions
+            ]
+            
+            with open(output_file, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+                writer = csv.writer(f)
+                writer.writerow(['question', 'option_a', 'option_b', 'option_c', 'option_d', 'correct_answer', 'explanation'])
+                writer.writerows(rows)
+            
+            return True, f"Saved {len(self.questions)} questions to CSV"
+        except Exception as e:
+            return False, f"Error saving CSV: {str(e)}"
+
+
+    def save_to_json(self, output_file: str):
+        """Save questions to JSON."""
+        try:
+            data = {
+                "title": self.quiz_title,
+                "description": self.quiz_description,
+                "questions": self.questions
+            }
+            
+            if orjson:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
             
-            return True, f"Generated HTML quiz with {len(self.questions)} questions" + (f" ({len(image_files)} with images)" if has_images else "")
+            return True, f"Saved {len(self.questions)} questions to JSON"
         except Exception as e:
-            return False, f"Error generating HTML: {str(e)}"
+            return False, f"Error saving JSON: {str(e)}"
+
+
+    def generate_html(self, output_file: str):
+        """Generate clean HTML quiz file without image instructions."""
+        # Settings are set as attributes by the app; render from plain data
+        return generate_quiz_html(output_file, self.questions, self.quiz_title,
+                                  self.quiz_description, self.__dict__)
 
 
     def generate_markdown(self, output_file: str):
@@ -2921,97 +1712,95 @@ class QuizGenerator:
             author = getattr(self, 'author', '')
             company = getattr(self, 'company', 'Multiaxis Intelligence')
             
-            # Check for images
-            image_files = {}
-            for i, q in enumerate(self.questions, 1):
-                if q.get('image'):
-                    image_files[i] = q['image']
+            # Image table rows, collected in one pass (questions are already in order)
+            image_rows = [
+                f"| Question {i} | `{q['image']}` | {q['question'][:50]}... |\n"
+                for i, q in enumerate(self.questions, 1) if q.get('image')
+            ]
             
-            md_content = f"# {self.quiz_title}\n\n"
-            md_content += f"## {self.quiz_description}\n\n"
+            # Pieces are joined once at the end rather than grown with +=
+            md = [f"# {self.quiz_title}\n\n"]
+            md.append(f"## {self.quiz_description}\n\n")
             
             # Add metadata
             if author:
-                md_content += f"**Author:** {author}\n\n"
+                md.append(f"**Author:** {author}\n\n")
             if company:
-                md_content += f"**Organization:** {company}\n\n"
+                md.append(f"**Organization:** {company}\n\n")
             
-            md_content += f"**Date Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            md.append(f"**Date Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
-            md_content += "---\n\n"
+            md.append("---\n\n")
             
             # Add image setup instructions if images are present
-            if image_files:
-                md_content += "## 📌 Image Setup Instructions\n\n"
-                md_content += "This quiz requires the following image files to be placed in the same folder as the HTML file:\n\n"
-                md_content += "| Question | Image File | Description |\n"
-                md_content += "|----------|------------|-------------|\n"
+            if image_rows:
+                md.append("## 📌 Image Setup Instructions\n\n")
+                md.append("This quiz requires the following image files to be placed in the same folder as the HTML file:\n\n")
+                md.append("| Question | Image File | Description |\n")
+                md.append("|----------|------------|-------------|\n")
+                md.extend(image_rows)
                 
-                for q_num, img_file in sorted(image_files.items()):
-                    question_text = self.questions[q_num-1]['question'][:50] + "..."
-                    md_content += f"| Question {q_num} | `{img_file}` | {question_text} |\n"
+                md.append("\n**Image Specifications:**\n")
+                md.append("- Recommended size: 1024x1024 pixels\n")
+                md.append("- Format: PNG or JPG\n")
+                md.append("- Location: Same folder as the HTML quiz file\n\n")
                 
-                md_content += "\n**Image Specifications:**\n"
-                md_content += "- Recommended size: 1024x1024 pixels\n"
-                md_content += "- Format: PNG or JPG\n"
-                md_content += "- Location: Same folder as the HTML quiz file\n\n"
-                
-                md_content += "**To Update Image Paths:**\n"
-                md_content += "1. Open the HTML file in a text editor\n"
-                md_content += "2. Find the `IMAGE_PATHS` section near the top\n"
-                md_content += "3. Update the paths to match your file locations\n\n"
-                md_content += "---\n\n"
+                md.append("**To Update Image Paths:**\n")
+                md.append("1. Open the HTML file in a text editor\n")
+                md.append("2. Find the `IMAGE_PATHS` section near the top\n")
+                md.append("3. Update the paths to match your file locations\n\n")
+                md.append("---\n\n")
             
             # Add questions and answers
-            md_content += "## Questions and Answers\n\n"
+            md.append("## Questions and Answers\n\n")
             
             for i, q in enumerate(self.questions, 1):
-                md_content += f"### Question {i}"
+                md.append(f"### Question {i}")
                 
                 # Add difficulty if present
                 if q.get('difficulty'):
-                    md_content += f" *(Difficulty: {q['difficulty']})*"
+                    md.append(f" *(Difficulty: {q['difficulty']})*")
                 
                 # Add image indicator
                 if q.get('image'):
-                    md_content += f" 🖼️ *[Image: {q['image']}]*"
+                    md.append(f" 🖼️ *[Image: {q['image']}]*")
                 
-                md_content += "\n"
-                md_content += f"**Q:** {q['question']}\n\n"
-                md_content += "**Options:**\n"
+                md.append("\n")
+                md.append(f"**Q:** {q['question']}\n\n")
+                md.append("**Options:**\n")
                 
                 for j, option in enumerate(q['options']):
                     marker = " ✓" if j == q['correct'] else ""
-                    md_content += f"- {chr(65+j)}) {option}{marker}\n"
+                    md.append(f"- {chr(65+j)}) {option}{marker}\n")
                 
-                md_content += f"\n**Answer:** {chr(65+q['correct'])}) {q['options'][q['correct']]}\n\n"
+                md.append(f"\n**Answer:** {chr(65+q['correct'])}) {q['options'][q['correct']]}\n\n")
                 
                 if q['explanation']:
-                    md_content += f"**Explanation:** {q['explanation']}\n\n"
+                    md.append(f"**Explanation:** {q['explanation']}\n\n")
                 
-                md_content += "---\n\n"
+                md.append("---\n\n")
             
             # Add scoring guide
             total = len(self.questions)
-            md_content += "## Scoring Guide\n\n"
+            md.append("## Scoring Guide\n\n")
             
             # Check for pass threshold
             pass_threshold = getattr(self, 'pass_threshold', 70)
             
-            md_content += f"**Passing Score:** {pass_threshold}%\n\n"
-            md_content += f"- **{int(total*0.9)}-{total} correct (90-100%):** Outstanding! Expert level mastery.\n"
-            md_content += f"- **{int(total*0.8)}-{int(total*0.9)-1} correct (80-89%):** Excellent! Strong understanding.\n"
-            md_content += f"- **{int(total*0.7)}-{int(total*0.8)-1} correct (70-79%):** Good! Meets passing threshold.\n"
-            md_content += f"- **{int(total*0.6)}-{int(total*0.7)-1} correct (60-69%):** Fair. Review missed topics.\n"
-            md_content += f"- **Below {int(total*0.6)} correct (<60%):** Needs improvement. Study and retake.\n\n"
+            md.append(f"**Passing Score:** {pass_threshold}%\n\n")
+            md.append(f"- **{int(total*0.9)}-{total} correct (90-100%):** Outstanding! Expert level mastery.\n")
+            md.append(f"- **{int(total*0.8)}-{int(total*0.9)-1} correct (80-89%):** Excellent! Strong understanding.\n")
+            md.append(f"- **{int(total*0.7)}-{int(total*0.8)-1} correct (70-79%):** Good! Meets passing threshold.\n")
+            md.append(f"- **{int(total*0.6)}-{int(total*0.7)-1} correct (60-69%):** Fair. Review missed topics.\n")
+            md.append(f"- **Below {int(total*0.6)} correct (<60%):** Needs improvement. Study and retake.\n\n")
             
             # Add footer
-            md_content += "---\n\n"
-            md_content += f"*Generated with Quiz Generator - {company}*\n"
-            md_content += f"*©2025 {company}. All rights reserved*\n"
+            md.append("---\n\n")
+            md.append(f"*Generated with Quiz Generator - {company}*\n")
+            md.append(f"*©2025 {company}. All rights reserved*\n")
             
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(md_content)
+                f.write("".join(md))
             
             return True, f"Generated markdown answer key with {len(self.questions)} questions"
         except Exception as e:
@@ -3030,17 +1819,8 @@ class QuizGenerator:
         # Format date
         formatted_date = datetime.now().strftime("%B %d, %Y")
         
-        # Try to embed logo as base64
-        logo_base64 = ""
-        logo_path = resource_path('assets/MultiaxisQuizGenerator_logo.png')
-        try:
-            with open(logo_path, 'rb') as f:
-                logo_data = f.read()
-                logo_base64 = base64.b64encode(logo_data).decode('utf-8')
-                logo_base64 = f"data:image/png;base64,{logo_base64}"
-        except:
-            # Fallback to SVG placeholder
-            logo_base64 = "data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='200' height='80' viewBox='0 0 200 80'%3E%3Crect width='200' height='80' fill='%232C5282'/%3E%3Ctext x='100' y='40' font-family='Arial' font-size='16' fill='white' text-anchor='middle' dominant-baseline='middle'%3EMULTIAXIS%3C/text%3E%3C/svg%3E"
+        # Embed logo as base64
+        logo_base64 = get_logo_base64()
         
         # Performance level and colors
         if score_percentage >= 95:
@@ -3066,9 +1846,10 @@ class QuizGenerator:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Certificate - {user_name}</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@700&family=Open+Sans:wght@400;600&display=swap">
     <style>
-        @import url('https://fonts.googleapis.com/css2?family=Playfair+Display:wght@700&family=Open+Sans:wght@400;600&display=swap');
-        
         * {{
             margin: 0;
             padding: 0;
@@ -3611,7 +2392,9 @@ class QuizGeneratorApp:
             'randomize': False,
             'timer_minutes': 0,
             'pass_threshold': 70,
-            'enable_certificate': False
+            'enable_certificate': False,
+            'external_css': False,
+            'precompress': False
         }
         
         # Try to load from AppData settings file first
@@ -3755,6 +2538,12 @@ class QuizGeneratorApp:
         self.enable_certificate_var = tk.BooleanVar(value=self.settings.get('enable_certificate', False))
         ttk.Checkbutton(options_frame, text="Enable Certificate", variable=self.enable_certificate_var).grid(row=0, column=4, padx=10)
         
+        self.external_css_var = tk.BooleanVar(value=self.settings.get('external_css', False))
+        ttk.Checkbutton(options_frame, text="Shared Stylesheet", variable=self.external_css_var).grid(row=0, column=5, padx=10)
+        
+        self.precompress_var = tk.BooleanVar(value=self.settings.get('precompress', False))
+        ttk.Checkbutton(options_frame, text="Gzip Copy", variable=self.precompress_var).grid(row=0, column=6, padx=10)
+        
         # Row 4: Timer and Pass Threshold
         settings_frame = ttk.Frame(title_frame)
         settings_frame.grid(row=3, column=0, columnspan=4, pady=5)
@@ -3789,7 +2578,7 @@ class QuizGeneratorApp:
         
         # Create dropdown for sample quizzes
         self.sample_var = tk.StringVar()
-        sample_names = list(SAMPLE_QUIZZES.keys())
+        sample_names = list(get_sample_quizzes().keys())
         self.sample_dropdown = ttk.Combobox(load_frame, textvariable=self.sample_var, 
                                            values=sample_names, state="readonly", width=25)
         self.sample_dropdown.grid(row=0, column=6, padx=5)
@@ -4106,7 +2895,7 @@ class QuizGeneratorApp:
         """Load a sample quiz from the embedded samples."""
         selected = self.sample_var.get()
         
-        if selected == "Select a sample quiz..." or selected not in SAMPLE_QUIZZES:
+        if selected == "Select a sample quiz..." or selected not in get_sample_quizzes():
             self.show_notification("Please select a sample quiz from the dropdown", "warning")
             return
         
@@ -4126,7 +2915,7 @@ class QuizGeneratorApp:
                 self.quiz_gen.clear_questions()
         
         # Load the sample quiz
-        sample_data = SAMPLE_QUIZZES[selected]
+        sample_data = get_sample_quizzes()[selected]
         
         # Update title and description
         self.title_var.set(selected)
@@ -4232,6 +3021,8 @@ Q: Next question here..."""
         self.settings['allow_review'] = self.allow_review_var.get()
         self.settings['randomize'] = self.randomize_var.get()
         self.settings['enable_certificate'] = self.enable_certificate_var.get()
+        self.settings['external_css'] = self.external_css_var.get()
+        self.settings['precompress'] = self.precompress_var.get()
         self.settings['timer_minutes'] = self.timer_var.get()
         self.settings['pass_threshold'] = self.pass_threshold_var.get()
         self.save_settings()
@@ -4563,6 +3354,8 @@ Q: Next question here..."""
                 self.quiz_gen.allow_review = self.allow_review_var.get()
                 self.quiz_gen.randomize = self.randomize_var.get()
                 self.quiz_gen.enable_certificate = self.enable_certificate_var.get()
+                self.quiz_gen.external_css = self.external_css_var.get()
+                self.quiz_gen.precompress = self.precompress_var.get()
                 self.quiz_gen.timer_minutes = self.timer_var.get()
                 self.quiz_gen.pass_threshold = self.pass_threshold_var.get()
                 
@@ -4745,7 +3538,11 @@ Q: Next question here..."""
                 text_widget.config(state="normal")
                 text_widget.delete("1.0", tk.END)
                 try:
-                    with open(self.log_file, "r") as f:
+                    # Write out any buffered records before reading
+                    if LOG_LISTENER:
+                        for handler in LOG_LISTENER.handlers:
+                            handler.flush()
+                    with open(self.log_file, "r", encoding="utf-8", errors="replace") as f:
                         content = f.read()
                     text_widget.insert("1.0", content)
                     text_widget.see(tk.END)  # scroll to bottom
@@ -5213,6 +4010,27 @@ knowledge assessments and training materials."""
 
 def main():
     """Main entry point with error handling and single instance check."""
+    # In the frozen exe, generate_many() workers re-run the entry point; this
+    # hands them to multiprocessing instead of starting another GUI
+    multiprocessing.freeze_support()
+    
+    # Initialize logging before anything else
+    global LOG_FILE
+    LOG_FILE = setup_logging()
+    
+    print("="*60)
+    print("Quiz Generator - Multiaxis Intelligence")
+    print("="*60)
+    print(f"Log file: {LOG_FILE}")
+    print("Starting GUI application...")
+    print("\nFeatures:")
+    print("• Load questions from CSV, JSON, or text files")
+    print("• Add questions manually")
+    print("• Generate interactive HTML quizzes")
+    print("• Export to various formats")
+    print("\nWindow should open momentarily...")
+    print("="*60)
+    
     try:
         # Check for single instance
         if not create_app_mutex():
@@ -5255,17 +4073,4 @@ def main():
 
 
 if __name__ == "__main__":
-    print("="*60)
-    print("Quiz Generator - Multiaxis Intelligence")
-    print("="*60)
-    print(f"Log file: {LOG_FILE}")
-    print("Starting GUI application...")
-    print("\nFeatures:")
-    print("• Load questions from CSV, JSON, or text files")
-    print("• Add questions manually")
-    print("• Generate interactive HTML quizzes")
-    print("• Export to various formats")
-    print("\nWindow should open momentarily...")
-    print("="*60)
-    
     main()